@@ -0,0 +1,317 @@
+"""
+Benchmark suite for utils/ml_models.py
+
+Times MLModelBuilder and ModelEvaluator on synthetic data, records peak
+Python-level memory, writes JSON results and can compare them against a
+stored baseline.
+
+    python benchmarks/bench_ml_models.py --sizes 1000,10000 --output bench.json
+    python benchmarks/bench_ml_models.py --output new.json --baseline bench.json --threshold 0.2
+"""
+import os
+import sys
+import io
+import json
+import time
+import argparse
+import platform
+import threading
+import tracemalloc
+import contextlib
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.datasets import make_classification, make_regression, make_blobs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.ml_models import MLModelBuilder, ModelEvaluator
+
+WIDTHS = {
+    'narrow': 10,
+    'wide': 200
+}
+
+# Cases whose cost grows much faster than linearly are skipped above these row counts
+ROW_LIMITS = {
+    'classification/SVM': 20000,
+    'regression/SVR': 20000,
+    'classification/KNN': 100000,
+    'regression/KNN': 100000,
+    'classification/Gradient Boosting': 100000,
+    'regression/Gradient Boosting': 100000,
+    'perform_clustering': 20000,
+    'hyperparameter_tuning': 100000,
+    'hyperparameter_tuning/2_workers_shared': 100000,
+    'hyperparameter_tuning/2_workers_pickled': 100000,
+    'learning_curve': 100000,
+    'learning_curve/2_workers_shared': 100000,
+    'learning_curve/2_workers_pickled': 100000
+}
+
+def make_frame(problem_type, n_rows, n_features, seed=42):
+    """Synthetic DataFrame with a 'target' column (no target for clustering)"""
+    if problem_type == 'classification':
+        X, y = make_classification(n_samples=n_rows, n_features=n_features, n_informative=min(n_features, 8),
+                                   n_classes=3, random_state=seed)
+    elif problem_type == 'regression':
+        X, y = make_regression(n_samples=n_rows, n_features=n_features, n_informative=min(n_features, 8),
+                               noise=10, random_state=seed)
+    else:
+        X, _ = make_blobs(n_samples=n_rows, n_features=n_features, centers=4, random_state=seed)
+        y = None
+    
+    df = pd.DataFrame(X.astype(np.float64), columns=[f"feature_{i}" for i in range(n_features)])
+    if y is not None:
+        df['target'] = y
+    return df
+
+def _child_pids(pid):
+    """Direct and indirect child processes of pid (Linux /proc)"""
+    children = []
+    for task in os.listdir(f'/proc/{pid}/task'):
+        try:
+            with open(f'/proc/{pid}/task/{task}/children') as f:
+                children.extend(int(child) for child in f.read().split())
+        except OSError:
+            pass
+    return children + [grandchild for child in children for grandchild in _child_pids(child)]
+
+def _process_memory_mb(pid):
+    """Proportional set size of one process, or its RSS where PSS is unavailable
+    
+    PSS splits shared pages (such as a memory-mapped training set) between the
+    processes mapping them, so summing it across workers does not count them
+    once per worker the way RSS does.
+    """
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    return int(line.split()[1]) / 1024
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+class ProcessTreeMemorySampler:
+    """Samples the summed memory of this process and its workers in a background thread"""
+    
+    def __init__(self, interval=0.02):
+        self.interval = interval
+        self.peak_mb = None
+        self._stop = threading.Event()
+        self._thread = None
+    
+    @staticmethod
+    def available():
+        return os.path.exists(f'/proc/{os.getpid()}/task')
+    
+    def sample(self):
+        pid = os.getpid()
+        return sum(_process_memory_mb(process) for process in [pid] + _child_pids(pid))
+    
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_mb = max(self.peak_mb or 0.0, self.sample())
+            self._stop.wait(self.interval)
+    
+    def __enter__(self):
+        if self.available():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+
+def measure(func, repeat=1, trace_memory=True):
+    """Run func and return (result, best wall time, its CPU time, peak traced memory in MB,
+    peak process-tree memory in MB)
+    
+    tracemalloc slows allocation-heavy code considerably, so timings come from
+    untraced runs and peak memory from one extra traced run. tracemalloc only
+    sees the parent's Python allocations; the process-tree figure also covers
+    worker processes and native buffers.
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = func()
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        
+        if best is None or wall_time < best[0]:
+            best = (wall_time, cpu_time)
+    
+    peak_mb = None
+    tree_peak_mb = None
+    if trace_memory:
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_mb = peak / 1024**2
+        
+        with ProcessTreeMemorySampler() as sampler, contextlib.redirect_stdout(io.StringIO()):
+            func()
+        tree_peak_mb = sampler.peak_mb
+    
+    return (result,) + best + (peak_mb, tree_peak_mb)
+
+def run_cases(n_rows, width_name, repeat=1, trace_memory=True):
+    """Benchmark every case for one data size and width"""
+    n_features = WIDTHS[width_name]
+    records = []
+    
+    def record(case, func):
+        limit = ROW_LIMITS.get(case)
+        if limit is not None and n_rows > limit:
+            return None
+        result, wall_time, cpu_time, peak_mb, tree_peak_mb = measure(func, repeat, trace_memory)
+        records.append({
+            'case': case,
+            'rows': n_rows,
+            'features': n_features,
+            'width': width_name,
+            'wall_time': wall_time,
+            'cpu_time': cpu_time,
+            'peak_memory_mb': peak_mb,
+            'peak_process_tree_mb': tree_peak_mb
+        })
+        memory = f"{peak_mb:9.1f} MB" if peak_mb is not None else "      n/a"
+        tree_memory = f"{tree_peak_mb:9.1f} MB" if tree_peak_mb is not None else "      n/a"
+        print(f"  {case:<45} {wall_time:9.3f}s  cpu {cpu_time:9.3f}s  peak {memory}  tree {tree_memory}")
+        return result
+    
+    for problem_type in ('classification', 'regression'):
+        df = make_frame(problem_type, n_rows, n_features)
+        builder = MLModelBuilder()
+        split = record(f'prepare_data/{problem_type}', lambda: builder.prepare_data(df, 'target'))
+        X_train, X_test, y_train, y_test = split
+        record(f'prepare_data_float32/{problem_type}',
+               lambda: MLModelBuilder().prepare_data(df, 'target', dtype=np.float32))
+        
+        if problem_type == 'classification':
+            registry, train = builder.classification_models, builder.train_classification_models
+        else:
+            registry, train = builder.regression_models, builder.train_regression_models
+        
+        for model_name in registry:
+            record(f'{problem_type}/{model_name}',
+                   lambda: train(X_train, X_test, y_train, y_test, models_to_train=[model_name]))
+        
+        if 'Random Forest' in builder.models:
+            record(f'predict_new_data/{problem_type}',
+                   lambda: builder.predict_new_data('Random Forest', X_test))
+        
+        if problem_type == 'classification':
+            param_grid = {'n_neighbors': [3, 5, 7], 'weights': ['uniform', 'distance']}
+            record('hyperparameter_tuning',
+                   lambda: builder.hyperparameter_tuning('KNN', X_train, y_train, param_grid, cv=3))
+            record('learning_curve',
+                   lambda: ModelEvaluator.plot_learning_curve(registry['Logistic Regression'], X_train, y_train, cv=3))
+            
+            # Two workers with and without the memory-mapped training data handoff
+            for share_memory in (True, False):
+                suffix = 'shared' if share_memory else 'pickled'
+                record(f'hyperparameter_tuning/2_workers_{suffix}',
+                       lambda: builder.hyperparameter_tuning('KNN', X_train, y_train, param_grid, cv=3, n_jobs=2,
+                                                             share_memory=share_memory))
+                record(f'learning_curve/2_workers_{suffix}',
+                       lambda: ModelEvaluator.plot_learning_curve(registry['Logistic Regression'], X_train, y_train,
+                                                                  cv=3, n_jobs=2, share_memory=share_memory))
+    
+    df = make_frame('clustering', n_rows, n_features)
+    record('perform_clustering', lambda: MLModelBuilder().perform_clustering(df))
+    
+    return records
+
+def compare(results, baseline, threshold):
+    """Return rows comparing wall times to a baseline, flagging slowdowns above threshold"""
+    baseline_times = {
+        (record['case'], record['rows'], record['features']): record['wall_time']
+        for record in baseline['results']
+    }
+    
+    rows = []
+    for record in results['results']:
+        key = (record['case'], record['rows'], record['features'])
+        if key not in baseline_times:
+            continue
+        ratio = record['wall_time'] / baseline_times[key] if baseline_times[key] > 0 else np.inf
+        rows.append({
+            'case': record['case'],
+            'rows': record['rows'],
+            'features': record['features'],
+            'baseline_time': baseline_times[key],
+            'wall_time': record['wall_time'],
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold
+        })
+    
+    return pd.DataFrame(rows)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='1000,10000,100000',
+                        help="comma-separated row counts (up to 1000000)")
+    parser.add_argument('--widths', default='narrow,wide', help="comma-separated subset of narrow,wide")
+    parser.add_argument('--repeat', type=int, default=1, help="runs per case; the fastest is kept")
+    parser.add_argument('--skip-memory', action='store_true', help="skip the traced peak-memory runs")
+    parser.add_argument('--output', default='bench_results.json', help="where to write JSON results")
+    parser.add_argument('--baseline', help="JSON results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="relative slowdown counted as a regression (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+    
+    results = {
+        'metadata': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'sklearn': sklearn.__version__,
+            'cpu_count': os.cpu_count()
+        },
+        'results': []
+    }
+    
+    for n_rows in [int(float(size)) for size in args.sizes.split(',')]:
+        for width_name in args.widths.split(','):
+            print(f"{n_rows} rows, {width_name} ({WIDTHS[width_name]} features)")
+            results['results'].extend(run_cases(n_rows, width_name, args.repeat, not args.skip_memory))
+    
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {len(results['results'])} results to {args.output}")
+    
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        comparison = compare(results, baseline, args.threshold)
+        if comparison.empty:
+            print("No overlapping cases with the baseline")
+            return 0
+        print(comparison.to_string(index=False))
+        regressions = comparison[comparison['regression']]
+        if len(regressions) > 0:
+            print(f"{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+            return 1
+    
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Batch scoring for models saved with MLModelBuilder.save_model
+
+Streams a CSV or Parquet file in chunks, scores them across worker processes
+and writes predictions (and class probabilities) to a CSV or Parquet file.
+
+    python -m utils.batch_score model.joblib input.csv predictions.csv --n-jobs 4
+    python -m utils.batch_score model.joblib input.parquet out.parquet --keep-columns customer_id
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.chunked_io import is_parquet_path, iter_table_chunks
+from utils.model_store import load_model_bundle
+from utils.ml_models import score_chunk, _init_scoring_worker, _score_worker_chunk, _resolve_n_jobs
+
+def _prepare_chunk(chunk, feature_columns, fill_values):
+    """Select the model's features in training order and fill gaps with the training means"""
+    missing = [col for col in feature_columns if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Input is missing feature columns: {missing}")
+    
+    X = chunk[feature_columns]
+    if fill_values is not None:
+        X = X.fillna(fill_values)
+    return X.to_numpy(dtype=np.float64)
+
+def _output_frame(chunk, keep_columns, predictions, probabilities, classes):
+    """Assemble the rows written for one scored chunk"""
+    output = chunk[keep_columns].reset_index(drop=True) if keep_columns else pd.DataFrame(index=range(len(chunk)))
+    if predictions is not None:
+        output['prediction'] = predictions
+    if probabilities is not None:
+        for j, label in enumerate(classes):
+            output[f'proba_{label}'] = probabilities[:, j]
+    return output
+
+class _OutputWriter:
+    """Appends scored chunks to a CSV file or, with pyarrow, a Parquet file"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.parquet = is_parquet_path(path)
+        self._writer = None
+        self._header = True
+        
+        if self.parquet:
+            try:
+                import pyarrow
+                import pyarrow.parquet
+            except ImportError:
+                raise ImportError("Writing Parquet output requires pyarrow (pip install pyarrow)")
+        
+        # Start from an empty file; chunks are appended as they finish
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if os.path.exists(path):
+            os.remove(path)
+    
+    def write(self, frame):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode='a', header=self._header, index=False)
+            self._header = False
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+def _iter_scored_chunks(bundle, source, chunksize, columns, fill_values, output, n_workers):
+    """Yield (chunk, predictions, probabilities) in input order, keeping a few chunks in flight"""
+    model, scaler = bundle['model'], bundle['scaler']
+    feature_columns = bundle['feature_columns']
+    chunks = iter_table_chunks(source, chunksize, columns)
+    
+    if n_workers == 1:
+        for chunk in chunks:
+            X = _prepare_chunk(chunk, feature_columns, fill_values)
+            predictions, probabilities = score_chunk(model, X, scaler, output)
+            yield chunk, predictions, probabilities
+        return
+    
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_scoring_worker,
+                             initargs=(model, scaler)) as executor:
+        pending = []
+        for chunk in chunks:
+            X = _prepare_chunk(chunk, feature_columns, fill_values)
+            pending.append((chunk, executor.submit(_score_worker_chunk, 0, X, output)))
+            if len(pending) >= 2 * n_workers:
+                chunk, future = pending.pop(0)
+                _, predictions, probabilities = future.result()
+                yield chunk, predictions, probabilities
+        
+        for chunk, future in pending:
+            _, predictions, probabilities = future.result()
+            yield chunk, predictions, probabilities
+
+def score_file(model_path, input_path, output_path, chunksize=100000, n_jobs=1, output='both',
+               keep_columns=None, fill_missing=True, progress=None):
+    """Score input_path with a saved model bundle and write the results to output_path
+    
+    Returns throughput statistics. progress, if given, is called with the
+    running statistics after every chunk.
+    """
+    bundle = load_model_bundle(model_path)
+    if bundle['feature_columns'] is None:
+        raise ValueError("The saved model does not record its feature columns; save it with feature_columns=")
+    
+    model, scaler = bundle['model'], bundle['scaler']
+    keep_columns = list(keep_columns or [])
+    columns = list(dict.fromkeys(bundle['feature_columns'] + keep_columns))
+    
+    # Missing features become the training mean, i.e. zero after scaling
+    fill_values = None
+    if fill_missing and scaler is not None and getattr(scaler, 'mean_', None) is not None:
+        fill_values = dict(zip(bundle['feature_columns'], scaler.mean_))
+    
+    classes = getattr(model, 'classes_', None)
+    n_workers = _resolve_n_jobs(n_jobs, max(n_jobs or 1, os.cpu_count() or 1))
+    writer = _OutputWriter(output_path)
+    
+    stats = {'rows': 0, 'chunks': 0, 'seconds': 0.0, 'rows_per_second': 0.0, 'n_workers': n_workers}
+    started = time.perf_counter()
+    try:
+        for chunk, predictions, probabilities in _iter_scored_chunks(
+            bundle, input_path, chunksize, columns, fill_values, output, n_workers
+        ):
+            writer.write(_output_frame(chunk, keep_columns, predictions, probabilities, classes))
+            
+            stats['rows'] += len(chunk)
+            stats['chunks'] += 1
+            stats['seconds'] = time.perf_counter() - started
+            stats['rows_per_second'] = stats['rows'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+            if progress is not None:
+                progress(dict(stats))
+    finally:
+        writer.close()
+    
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('model', help="model bundle written by MLModelBuilder.save_model")
+    parser.add_argument('input', help="CSV or Parquet file to score")
+    parser.add_argument('output', help="CSV or Parquet file for the predictions")
+    parser.add_argument('--chunksize', type=int, default=100000, help="rows read and scored per chunk")
+    parser.add_argument('--n-jobs', type=int, default=1, help="worker processes (-1 for all cores)")
+    parser.add_argument('--output-type', choices=['both', 'labels', 'proba'], default='both',
+                        help="write labels, class probabilities or both")
+    parser.add_argument('--keep-columns', default='', help="comma-separated input columns copied to the output")
+    parser.add_argument('--no-fill-missing', action='store_true',
+                        help="pass missing feature values to the model instead of the training means")
+    parser.add_argument('--stats', help="also write the throughput statistics to this JSON file")
+    parser.add_argument('--quiet', action='store_true', help="no per-chunk progress on stderr")
+    args = parser.parse_args(argv)
+    
+    def progress(stats):
+        print(f"  {stats['rows']:>12,} rows  {stats['rows_per_second']:>12,.0f} rows/s", file=sys.stderr)
+    
+    stats = score_file(
+        args.model, args.input, args.output, chunksize=args.chunksize, n_jobs=args.n_jobs,
+        output=args.output_type, keep_columns=[col for col in args.keep_columns.split(',') if col],
+        fill_missing=not args.no_fill_missing, progress=None if args.quiet else progress
+    )
+    
+    print(f"Scored {stats['rows']:,} rows in {stats['seconds']:.2f}s "
+          f"({stats['rows_per_second']:,.0f} rows/s, {stats['n_workers']} worker(s)) -> {args.output}")
+    
+    if args.stats:
+        with open(args.stats, 'w') as f:
+            json.dump(stats, f, indent=2)
+    
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,33 @@
+import os
+import pandas as pd
+
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+
+def is_parquet_path(source):
+    """Check whether a path points at a Parquet file"""
+    return isinstance(source, (str, os.PathLike)) and str(source).lower().endswith(PARQUET_EXTENSIONS)
+
+def iter_table_chunks(source, chunksize=100000, columns=None, dtype=None):
+    """Yield DataFrame chunks from a CSV/Parquet path or an in-memory DataFrame
+    
+    dtype is passed to read_csv for CSV sources, so column types cannot
+    change from one chunk to the next.
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            chunk = source.iloc[start:start + chunksize]
+            yield chunk if columns is None else chunk[columns]
+        return
+    
+    if is_parquet_path(source):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet files in chunks requires pyarrow (pip install pyarrow)")
+        
+        parquet_file = pq.ParquetFile(source)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+    
+    yield from pd.read_csv(source, chunksize=chunksize, usecols=columns, dtype=dtype)
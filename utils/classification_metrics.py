@@ -0,0 +1,133 @@
+import numpy as np
+
+REPORT_HEADERS = ['precision', 'recall', 'f1-score', 'support']
+
+def encode_labels(y_true, *y_preds):
+    """Sorted union of the labels and integer codes for y_true and each prediction array"""
+    arrays = [np.asarray(y_true).ravel()] + [np.asarray(y_pred).ravel() for y_pred in y_preds]
+    classes, codes = np.unique(np.concatenate(arrays), return_inverse=True)
+    
+    n_samples = len(arrays[0])
+    return classes, codes[:n_samples], codes[n_samples:].reshape(len(y_preds), n_samples)
+
+def confusion_matrices(true_codes, pred_codes, n_classes):
+    """Confusion matrices for several prediction vectors from one bincount
+    
+    pred_codes has shape (n_models, n_samples); the result has shape
+    (n_models, n_classes, n_classes) with true labels along the rows.
+    """
+    pred_codes = np.atleast_2d(pred_codes)
+    n_models = len(pred_codes)
+    
+    cells = true_codes * n_classes + pred_codes
+    cells += (np.arange(n_models) * n_classes ** 2)[:, None]
+    counts = np.bincount(cells.ravel(), minlength=n_models * n_classes ** 2)
+    return counts.reshape(n_models, n_classes, n_classes)
+
+def _divide(numerator, denominator):
+    """Elementwise division that yields 0 where the denominator is 0, like zero_division=0"""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros(np.broadcast(numerator, denominator).shape),
+                     where=denominator != 0)
+
+def per_class_scores(confusion):
+    """Per-class precision, recall, F1 and support from one or a stack of confusion matrices"""
+    tp = np.diagonal(confusion, axis1=-2, axis2=-1)
+    true_sum = confusion.sum(axis=-1)
+    pred_sum = confusion.sum(axis=-2)
+    
+    # Same expressions as precision_recall_fscore_support so the values agree to the last bit
+    return {
+        'precision': _divide(tp, pred_sum),
+        'recall': _divide(tp, true_sum),
+        'f1': _divide(2 * tp.astype(np.float64), true_sum.astype(np.float64) + pred_sum),
+        'support': true_sum
+    }
+
+def _averages(scores):
+    """Macro and support-weighted averages of per-class scores over the last axis"""
+    support = scores['support']
+    total = support.sum(axis=-1)
+    averages = {}
+    for name in ('precision', 'recall', 'f1'):
+        values = scores[name]
+        averages[f'macro_{name}'] = values.sum(axis=-1) / values.shape[-1]
+        averages[f'weighted_{name}'] = _divide(np.multiply(values, support).sum(axis=-1), total)
+    return averages
+
+def format_classification_report(classes, scores, averages, accuracy, digits=2):
+    """Text report laid out exactly like sklearn.metrics.classification_report"""
+    target_names = ['%s' % label for label in classes]
+    width = max(max(len(name) for name in target_names), len('weighted avg'), digits)
+    
+    head_fmt = "{:>{width}s} " + " {:>9}" * len(REPORT_HEADERS)
+    report = head_fmt.format("", *REPORT_HEADERS, width=width)
+    report += "\n\n"
+    row_fmt = "{:>{width}s} " + " {:>9.{digits}f}" * 3 + " {:>9}\n"
+    for row in zip(target_names, scores['precision'], scores['recall'], scores['f1'], scores['support']):
+        report += row_fmt.format(*row, width=width, digits=digits)
+    report += "\n"
+    
+    support = np.sum(scores['support'])
+    row_fmt_accuracy = "{:>{width}s} " + " {:>9.{digits}}" * 2 + " {:>9.{digits}f}" + " {:>9}\n"
+    report += row_fmt_accuracy.format('accuracy', "", "", accuracy, support, width=width, digits=digits)
+    for average in ('macro', 'weighted'):
+        report += row_fmt.format(f'{average} avg', averages[f'{average}_precision'], averages[f'{average}_recall'],
+                                 averages[f'{average}_f1'], support, width=width, digits=digits)
+    return report
+
+def metrics_from_confusion(confusion, classes, digits=2):
+    """Accuracy, weighted precision/recall/F1, per-class scores and the text report from one confusion matrix"""
+    n_samples = confusion.sum()
+    accuracy = float(np.trace(confusion) / n_samples) if n_samples > 0 else 0.0
+    
+    scores = per_class_scores(confusion)
+    averages = _averages(scores)
+    
+    return {
+        'accuracy': accuracy,
+        'precision': float(averages['weighted_precision']),
+        'recall': float(averages['weighted_recall']),
+        'f1_score': float(averages['weighted_f1']),
+        'classification_report': format_classification_report(classes, scores, averages, accuracy, digits),
+        'confusion_matrix': confusion,
+        'per_class': {
+            'classes': classes,
+            'precision': scores['precision'],
+            'recall': scores['recall'],
+            'f1_score': scores['f1'],
+            'support': scores['support']
+        }
+    }
+
+def classification_metrics(y_true, y_pred, digits=2):
+    """All holdout classification metrics from a single pass over the labels"""
+    classes, true_codes, pred_codes = encode_labels(y_true, y_pred)
+    confusion = confusion_matrices(true_codes, pred_codes, len(classes))[0]
+    return metrics_from_confusion(confusion, classes, digits)
+
+def batch_classification_metrics(y_true, predictions, digits=2):
+    """Metrics for several models' predictions of the same y_true in one call
+    
+    predictions maps a model name to its predicted labels. The labels are
+    encoded once and every confusion matrix comes from a single bincount.
+    Each model's metrics cover the labels in y_true and its own predictions,
+    matching what classification_metrics returns for that model alone.
+    """
+    names = list(predictions.keys())
+    if not names:
+        return {}
+    
+    classes, true_codes, pred_codes = encode_labels(y_true, *[predictions[name] for name in names])
+    confusions = confusion_matrices(true_codes, pred_codes, len(classes))
+    
+    true_present = np.bincount(true_codes, minlength=len(classes)) > 0
+    
+    results = {}
+    for i, name in enumerate(names):
+        # Drop classes that neither y_true nor this model produced
+        present = true_present | (confusions[i].sum(axis=0) > 0)
+        confusion = confusions[i][np.ix_(present, present)]
+        results[name] = metrics_from_confusion(confusion, classes[present], digits)
+    return results
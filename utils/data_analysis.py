@@ -1,37 +1,465 @@
 import pandas as pd
 import numpy as np
-from scipy import stats
 from sklearn.preprocessing import StandardScaler, MinMaxScaler, LabelEncoder
 from sklearn.feature_selection import SelectKBest, f_classif, f_regression
 import warnings
+from collections import OrderedDict
+from utils.model_store import fingerprint_data
 warnings.filterwarnings('ignore')
 
+SUMMARY_INDEX = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max', 'skewness', 'kurtosis', 'median', 'mode']
+
+def _lerp(a, b, t):
+    """Linear interpolation written the way np.percentile does it, so quantiles match describe()"""
+    diff = b - a
+    result = a + diff * t
+    np.subtract(b, diff * (1 - t), out=result, where=t >= 0.5)
+    return result
+
+def _sorted_quantiles(sorted_values, counts, qs):
+    """Linear-interpolated quantiles of each column of a column-wise sorted array (NaNs sorted last)"""
+    columns = np.arange(sorted_values.shape[1])
+    last = np.maximum(counts - 1, 0)
+    if len(sorted_values) == 0:
+        return [np.full(len(columns), np.nan) for _ in qs]
+    
+    quantiles = []
+    for q in qs:
+        index = q * last
+        below = np.floor(index).astype(int)
+        above = np.minimum(below + 1, last)
+        quantile = _lerp(sorted_values[below, columns], sorted_values[above, columns], index - below)
+        quantile[counts == 0] = np.nan
+        quantiles.append(quantile)
+    return quantiles
+
+def _column_quantiles(values, qs):
+    """Quantiles of every column of a 2D array, ignoring NaNs, from one sort"""
+    return _sorted_quantiles(np.sort(values, axis=0), (~np.isnan(values)).sum(axis=0), qs)
+
+def _column_modes(sorted_values, counts):
+    """Smallest most frequent value of each column of a column-wise sorted array (NaNs sorted last)"""
+    n_rows, n_cols = sorted_values.shape
+    modes = np.full(n_cols, np.nan)
+    if n_rows == 0:
+        return modes
+    
+    # Walk all columns as one flat sequence; a run starts where the value or the column changes
+    flat = sorted_values.T.ravel()
+    column = np.repeat(np.arange(n_cols), n_rows)
+    boundary = np.ones(len(flat), dtype=bool)
+    boundary[1:] = (flat[1:] != flat[:-1]) | (column[1:] != column[:-1])
+    starts = np.flatnonzero(boundary)
+    lengths = np.diff(np.append(starts, len(flat)))
+    
+    # Drop the runs of NaN padding at the end of each column
+    valid = (starts % n_rows) < counts[column[starts]]
+    starts, lengths = starts[valid], lengths[valid]
+    run_columns = column[starts]
+    
+    # Longest run per column; ties go to the earliest (smallest) value like Series.mode
+    order = np.lexsort((starts, -lengths, run_columns))
+    first = order[np.r_[True, run_columns[order][1:] != run_columns[order][:-1]]]
+    modes[run_columns[first]] = flat[starts[first]]
+    return modes
+
+def _summarize_block(values):
+    """All summary rows for a 2D float block, one column per variable"""
+    mask = ~np.isnan(values)
+    counts = mask.sum(axis=0)
+    n = counts.astype(float)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(mask, values, 0).sum(axis=0) / n
+        centered = np.where(mask, values - mean, 0)
+        squared = centered * centered
+        m2 = squared.sum(axis=0) / n
+        m3 = (squared * centered).sum(axis=0) / n
+        m4 = (squared * squared).sum(axis=0) / n
+        std = np.sqrt(squared.sum(axis=0) / (n - 1))
+        std[counts < 2] = np.nan
+        
+        # Biased (population) skewness and excess kurtosis, NaN for constant columns like scipy.stats
+        constant = m2 <= (np.finfo(float).resolution * mean) ** 2
+        skewness = np.where(constant, np.nan, m3 / m2 ** 1.5)
+        kurtosis = np.where(constant, np.nan, m4 / m2 ** 2 - 3)
+    
+    # One sort serves min, max, the quartiles, the median and the mode
+    sorted_values = np.sort(values, axis=0)
+    columns = np.arange(values.shape[1])
+    last = np.maximum(counts - 1, 0)
+    empty = counts == 0
+    
+    def at(positions):
+        return sorted_values[positions, columns] if len(sorted_values) > 0 else np.full(len(columns), np.nan)
+    
+    quantiles = _sorted_quantiles(sorted_values, counts, (0.25, 0.5, 0.75))
+    median = (at(last // 2) + at((last + 1) // 2)) / 2
+    
+    rows = [n, mean, std, at(np.zeros_like(last)), *quantiles, at(last), skewness, kurtosis, median,
+            _column_modes(sorted_values, counts)]
+    block = np.vstack(rows)
+    block[1:, empty] = np.nan
+    return block
+
+def numeric_summary(df, columns=None, block_size=256):
+    """describe() plus skewness, kurtosis, median and mode for many numeric columns at once
+    
+    Each block of block_size columns is summarised with a handful of NaN-aware
+    NumPy reductions over one 2D array and a single sort.
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    
+    blocks = []
+    for start in range(0, len(columns), block_size):
+        values = df[columns[start:start + block_size]].to_numpy(dtype=np.float64, na_value=np.nan)
+        blocks.append(_summarize_block(values))
+    
+    data = np.hstack(blocks) if blocks else np.empty((len(SUMMARY_INDEX), 0))
+    return pd.DataFrame(data, index=SUMMARY_INDEX, columns=columns)
+
+def categorical_summary(df, columns=None, top_n=10):
+    """Unique count, most frequent value and top_n value counts for many categorical columns at once
+    
+    All columns are hashed in one factorize pass and counted with one sort, instead
+    of a value_counts call per column. Ties are ordered by first appearance.
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=['object']).columns.tolist()
+    
+    n_rows = len(df)
+    codes, uniques = pd.factorize(df[columns].to_numpy().ravel(order='F'))
+    column = np.repeat(np.arange(len(columns)), n_rows)
+    
+    # Count every (column, value) pair; missing values are coded -1 and skipped
+    valid = codes >= 0
+    keys = column[valid] * max(len(uniques), 1) + codes[valid]
+    positions = np.flatnonzero(valid)
+    keys, first_index, counts = np.unique(keys, return_index=True, return_counts=True)
+    key_columns = keys // max(len(uniques), 1)
+    key_values = uniques[keys % max(len(uniques), 1)] if len(keys) > 0 else keys
+    
+    # Highest count first within each column, earlier first appearance breaking ties
+    order = np.lexsort((positions[first_index], -counts, key_columns))
+    key_columns, key_values, counts = key_columns[order], key_values[order], counts[order]
+    bounds = np.searchsorted(key_columns, np.arange(len(columns) + 1))
+    
+    summary = {}
+    for i, col in enumerate(columns):
+        start, stop = bounds[i], bounds[i + 1]
+        summary[col] = {
+            'unique_count': stop - start,
+            'most_frequent': key_values[start] if stop > start else None,
+            'most_frequent_count': counts[start] if stop > start else 0,
+            'value_counts': dict(zip(key_values[start:min(stop, start + top_n)], counts[start:min(stop, start + top_n)]))
+        }
+    
+    return summary
+
+def _correlation_tile(block_i, block_j):
+    """Pairwise-complete Pearson correlations between two column blocks
+    
+    Each block is (values with NaN replaced by 0, presence mask as floats).
+    All sums are taken over the rows where both columns are present, using
+    matrix products instead of a loop over column pairs.
+    """
+    x_i, m_i = block_i
+    x_j, m_j = block_j
+    
+    n = m_i.T @ m_j
+    sum_i = x_i.T @ m_j
+    sum_j = m_i.T @ x_j
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = x_i.T @ x_j - sum_i * sum_j / n
+        var_i = (x_i * x_i).T @ m_j - sum_i * sum_i / n
+        var_j = m_i.T @ (x_j * x_j) - sum_j * sum_j / n
+        corr = cov / np.sqrt(var_i * var_j)
+    
+    corr[(n < 2) | (var_i <= 0) | (var_j <= 0)] = np.nan
+    return np.clip(corr, -1, 1)
+
+def _standardized_tile(z_i, z_j, n_rows):
+    """Correlations between blocks of complete, standardized columns"""
+    return np.clip(z_i.T @ z_j / n_rows, -1, 1)
+
+def blocked_correlation(values, threshold=0.5, return_matrix=True, block_size=512):
+    """Correlation matrix of the columns of values, computed tile by tile
+    
+    Returns (matrix or None, (rows, cols, correlations)) where the pair arrays
+    list every i < j with |r| > threshold in row-major order. Missing values
+    are handled pairwise like DataFrame.corr().
+    """
+    n_rows, n_cols = values.shape
+    complete = not np.isnan(values).any()
+    
+    if complete:
+        # Standardize once; every tile is then a single matrix product
+        with np.errstate(invalid='ignore', divide='ignore'):
+            centered = values - values.mean(axis=0)
+            scale = np.sqrt((centered * centered).mean(axis=0))
+            prepared = centered / scale
+        constant = ~(scale > 0)
+        prepared[:, constant] = 0
+    else:
+        # Centre on each column's mean to keep the one-pass sums well conditioned
+        mask = ~np.isnan(values)
+        prepared = np.where(mask, values - np.nanmean(values, axis=0), 0)
+        presence = mask.astype(np.float64)
+    
+    def block(start):
+        stop = min(start + block_size, n_cols)
+        if complete:
+            return prepared[:, start:stop]
+        return prepared[:, start:stop], presence[:, start:stop]
+    
+    matrix = np.empty((n_cols, n_cols)) if return_matrix else None
+    rows, cols, correlations = [], [], []
+    
+    starts = range(0, n_cols, block_size)
+    for start_i in starts:
+        block_i = block(start_i)
+        for start_j in starts:
+            if start_j < start_i:
+                continue
+            block_j = block(start_j)
+            
+            if complete:
+                tile = _standardized_tile(block_i, block_j, n_rows)
+                tile[constant[start_i:start_i + tile.shape[0]], :] = np.nan
+                tile[:, constant[start_j:start_j + tile.shape[1]]] = np.nan
+            else:
+                tile = _correlation_tile(block_i, block_j)
+            
+            if start_i == start_j:
+                diagonal = np.arange(tile.shape[0])
+                tile[diagonal, diagonal] = np.where(np.isnan(tile[diagonal, diagonal]), np.nan, 1.0)
+            
+            if matrix is not None:
+                matrix[start_i:start_i + tile.shape[0], start_j:start_j + tile.shape[1]] = tile
+                matrix[start_j:start_j + tile.shape[1], start_i:start_i + tile.shape[0]] = tile.T
+            
+            # Vectorized upper-triangle extraction of the strong pairs in this tile
+            with np.errstate(invalid='ignore'):
+                strong = np.abs(tile) > threshold
+            if start_i == start_j:
+                strong = np.triu(strong, k=1)
+            tile_rows, tile_cols = np.nonzero(strong)
+            rows.append(tile_rows + start_i)
+            cols.append(tile_cols + start_j)
+            correlations.append(tile[tile_rows, tile_cols])
+    
+    rows, cols, correlations = np.concatenate(rows), np.concatenate(cols), np.concatenate(correlations)
+    order = np.lexsort((cols, rows))
+    return matrix, (rows[order], cols[order], correlations[order])
+
+def outlier_mask(values, method='iqr', threshold=None):
+    """Boolean outlier mask for a 2D float array, one column per variable (NaNs are never outliers)
+    
+    method='isolation' returns a single column flagging whole rows.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if method == 'iqr':
+            k = 1.5 if threshold is None else threshold
+            q1, q3 = _column_quantiles(values, (0.25, 0.75))
+            iqr = q3 - q1
+            return (values < q1 - k * iqr) | (values > q3 + k * iqr)
+        
+        if method == 'zscore':
+            k = 3 if threshold is None else threshold
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0)
+            return np.abs(values - mean) / std > k
+        
+        if method == 'mad':
+            k = 3.5 if threshold is None else threshold
+            median, = _column_quantiles(values, (0.5,))
+            deviation = np.abs(values - median)
+            mad, = _column_quantiles(deviation, (0.5,))
+            # Modified z-score of Iglewicz and Hoaglin; columns with MAD 0 report none
+            return 0.6745 * deviation / mad > k
+    
+    if method == 'isolation':
+        from sklearn.ensemble import IsolationForest
+        
+        if values.shape[0] == 0 or values.shape[1] == 0:
+            return np.zeros((values.shape[0], 1), dtype=bool)
+        median, = _column_quantiles(values, (0.5,))
+        filled = np.where(np.isnan(values), np.nan_to_num(median), values)
+        forest = IsolationForest(n_estimators=100, max_samples=min(256, len(filled)),
+                                 contamination='auto' if threshold is None else threshold, random_state=42)
+        return (forest.fit_predict(filled) == -1)[:, None]
+    
+    raise ValueError("method must be 'iqr', 'zscore', 'mad' or 'isolation'")
+
+def _nbytes(value):
+    """Approximate memory held by a cached value"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(deep=True)))
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(_nbytes(item) for item in value.values())
+    return 0
+
+def unpack_outlier_mask(result):
+    """Boolean rows x columns mask from outlier_detection(packed=True)"""
+    return np.unpackbits(result['mask'], axis=0, count=result['n_rows']).astype(bool)
+
 class DataAnalyzer:
     """
     Comprehensive data analysis utility class
     """
     
-    def __init__(self, df):
-        """Initialize with a pandas DataFrame"""
+    def __init__(self, df, verify_frame=True, max_cache_mb=None):
+        """Initialize with a pandas DataFrame
+        
+        Per-column primitives (null counts, unique counts, the numeric matrix,
+        summaries, ranks, ...) are memoized and shared between the report
+        sections. Assigning analyzer.df clears the cache; with verify_frame
+        each call also compares a content hash of the frame, so in-place edits
+        are caught too (set it to False to check only shape, columns and dtypes).
+        max_cache_mb caps the memo: least recently used entries are evicted
+        past it and values larger than the cap are recomputed on each call
+        (0 effectively turns the memo off).
+        """
+        self.verify_frame = verify_frame
+        self.max_cache_mb = max_cache_mb
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self._cache_sizes = {}
+        self._signature = None
+        self._frame_checked = False
         self.df = df.copy()
-        self.numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
-        self.categorical_columns = df.select_dtypes(include=['object']).columns.tolist()
+    
+    @property
+    def df(self):
+        return self._df
+    
+    @df.setter
+    def df(self, df):
+        self._df = df
+        self._refresh_columns()
+        self.clear_cache()
+    
+    def _refresh_columns(self):
+        self.numeric_columns = self._df.select_dtypes(include=[np.number]).columns.tolist()
+        self.categorical_columns = self._df.select_dtypes(include=['object']).columns.tolist()
+    
+    def clear_cache(self, keys=None):
+        """Drop every memoized primitive, or only the given keys
+        
+        A key also matches the parameterized entries named after it, e.g.
+        'outlier_mask' drops the masks of every method and threshold.
+        """
+        if keys is None:
+            self._cache = OrderedDict()
+            self._cache_sizes = {}
+            self._signature = self._frame_signature()
+            return
+        keys = [keys] if isinstance(keys, str) else list(keys)
+        for key in list(self._cache):
+            name = key[0] if isinstance(key, tuple) else key
+            if key in keys or name in keys:
+                self._evict(key)
+    
+    def cache_info(self):
+        """Hit/miss counters, the cached keys and their sizes in MB"""
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'entries': len(self._cache),
+            'keys': list(self._cache.keys()),
+            'size_mb': sum(self._cache_sizes.values()) / 1024**2,
+            'entry_mb': {key: size / 1024**2 for key, size in self._cache_sizes.items()}
+        }
+    
+    def _frame_signature(self):
+        """Cheap structural signature, plus a content hash when verify_frame is set"""
+        signature = (self._df.shape, tuple(self._df.columns), tuple(self._df.dtypes.astype(str)))
+        if self.verify_frame:
+            try:
+                signature += (fingerprint_data(self._df),)
+            except TypeError:
+                # Unhashable cell values (e.g. lists); fall back to the structural check
+                pass
+        return signature
+    
+    def _check_frame(self):
+        """Invalidate the cache if the frame was modified in place since it was filled"""
+        if self._frame_checked:
+            return
+        signature = self._frame_signature()
+        if signature != self._signature:
+            self._refresh_columns()
+            self._cache = OrderedDict()
+            self._cache_sizes = {}
+            self._signature = signature
+    
+    def _cached(self, key, compute):
+        """Return the memoized value for key, computing it on the first request"""
+        if key in self._cache:
+            self.cache_hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        self.cache_misses += 1
+        value = compute()
+        size = _nbytes(value)
+        if self.max_cache_mb is None:
+            self._cache[key] = value
+            self._cache_sizes[key] = size
+            return value
+        
+        limit = self.max_cache_mb * 1024**2
+        if size > limit:
+            return value
+        while self._cache and sum(self._cache_sizes.values()) + size > limit:
+            self._evict(next(iter(self._cache)))
+        self._cache[key] = value
+        self._cache_sizes[key] = size
+        return value
+    
+    def _evict(self, key):
+        del self._cache[key]
+        del self._cache_sizes[key]
+    
+    def _numeric_values(self):
+        return self._cached('numeric_values', lambda: self.df[self.numeric_columns].to_numpy(
+            dtype=np.float64, na_value=np.nan))
+    
+    def _null_counts(self):
+        return self._cached('null_counts', lambda: self.df.isnull().sum())
+    
+    def _unique_counts(self):
+        return self._cached('unique_counts', lambda: self.df.nunique())
+    
+    def _numeric_summary(self):
+        return self._cached('numeric_summary', lambda: numeric_summary(self.df, self.numeric_columns))
+    
+    def _categorical_summary(self):
+        return self._cached('categorical_summary', lambda: categorical_summary(self.df, self.categorical_columns))
     
     def basic_info(self):
         """Return basic information about the dataset"""
+        self._check_frame()
         info = {
             'shape': self.df.shape,
             'columns': list(self.df.columns),
             'numeric_columns': self.numeric_columns,
             'categorical_columns': self.categorical_columns,
-            'memory_usage_mb': self.df.memory_usage(deep=True).sum() / 1024**2,
+            'memory_usage_mb': self._cached('memory_usage', lambda: self.df.memory_usage(deep=True).sum()) / 1024**2,
             'dtypes': dict(self.df.dtypes)
         }
         return info
     
     def missing_value_analysis(self):
         """Analyze missing values in the dataset"""
-        missing_data = self.df.isnull().sum()
+        self._check_frame()
+        missing_data = self._null_counts()
         missing_percent = (missing_data / len(self.df)) * 100
         
         missing_df = pd.DataFrame({
@@ -43,92 +471,108 @@ class DataAnalyzer:
         missing_df = missing_df[missing_df['Missing_Count'] > 0].sort_values('Missing_Count', ascending=False)
         return missing_df
     
-    def outlier_detection(self, method='iqr'):
-        """Detect outliers using IQR or Z-score method"""
-        outliers = {}
+    def outlier_detection(self, method='iqr', threshold=None, packed=False):
+        """Detect outliers using the IQR, Z-score, MAD or isolation forest method
+        
+        threshold defaults to 1.5 IQRs, 3 standard deviations or a modified
+        z-score of 3.5 for 'mad'; for 'isolation' it is the expected outlier
+        fraction ('auto' by default). 'isolation' scores whole rows across all
+        numeric columns and reports them under the key 'rows'. With packed=True
+        the result holds per-column counts and a bit-packed row mask (see
+        unpack_outlier_mask) instead of index arrays.
+        """
+        self._check_frame()
+        # Only the counts and the bit-packed mask are kept, 1/8 of the boolean mask
+        counts, bits = self._cached(('outlier_mask', method, threshold),
+                                    lambda: self._packed_outlier_mask(method, threshold))
+        columns = ['rows'] if method == 'isolation' else list(self.numeric_columns)
+        
+        percentages = counts / len(self.df) * 100 if len(self.df) > 0 else counts * 0.0
+        
+        if packed:
+            return {
+                'method': method,
+                'columns': columns,
+                'counts': pd.Series(counts, index=columns),
+                'percentages': pd.Series(percentages, index=columns),
+                'mask': bits.copy(),
+                'n_rows': len(self.df)
+            }
         
-        for col in self.numeric_columns:
-            if method == 'iqr':
-                Q1 = self.df[col].quantile(0.25)
-                Q3 = self.df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                outlier_mask = (self.df[col] < lower_bound) | (self.df[col] > upper_bound)
-            
-            elif method == 'zscore':
-                z_scores = np.abs(stats.zscore(self.df[col].dropna()))
-                outlier_mask = z_scores > 3
-            
+        index = self.df.index.to_numpy()
+        outliers = {}
+        for j, col in enumerate(columns):
+            rows = np.unpackbits(bits[:, j], count=len(self.df))
             outliers[col] = {
-                'count': outlier_mask.sum(),
-                'percentage': (outlier_mask.sum() / len(self.df)) * 100,
-                'indices': self.df[outlier_mask].index.tolist()
+                'count': counts[j],
+                'percentage': percentages[j],
+                'indices': index[np.flatnonzero(rows)]
             }
         
         return outliers
     
-    def correlation_analysis(self, threshold=0.5):
-        """Analyze correlations between numeric variables"""
+    def _packed_outlier_mask(self, method, threshold):
+        mask = outlier_mask(self._numeric_values(), method, threshold)
+        return mask.sum(axis=0), np.packbits(mask, axis=0)
+    
+    def correlation_analysis(self, threshold=0.5, method='pearson', return_matrix=True, block_size=512):
+        """Analyze correlations between numeric variables
+        
+        The matrix is computed in tiles of block_size columns and pairs with
+        |r| > threshold are pulled from each tile, so with return_matrix=False
+        the full p x p matrix is never held in memory. method='spearman' reuses
+        ranks cached on the analyzer; with missing values each column is ranked
+        once rather than per pair, so results can differ slightly from pandas.
+        """
+        self._check_frame()
         if len(self.numeric_columns) < 2:
             return None
         
-        corr_matrix = self.df[self.numeric_columns].corr()
+        if method == 'pearson':
+            values = self._numeric_values()
+        elif method == 'spearman':
+            values = self._ranks()
+        else:
+            raise ValueError("method must be 'pearson' or 'spearman'")
+        
+        matrix, pairs = self._cached(('correlation', method, threshold, return_matrix, block_size),
+                                     lambda: blocked_correlation(values, threshold, return_matrix, block_size))
         
-        # Find high correlations
-        high_corr_pairs = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i+1, len(corr_matrix.columns)):
-                corr_value = corr_matrix.iloc[i, j]
-                if abs(corr_value) > threshold:
-                    high_corr_pairs.append({
-                        'variable1': corr_matrix.columns[i],
-                        'variable2': corr_matrix.columns[j],
-                        'correlation': corr_value
-                    })
+        columns = self.numeric_columns
+        high_corr_pairs = [
+            {'variable1': columns[i], 'variable2': columns[j], 'correlation': corr_value}
+            for i, j, corr_value in zip(*pairs)
+        ]
         
         return {
-            'correlation_matrix': corr_matrix,
+            'correlation_matrix': pd.DataFrame(matrix.copy(), index=columns, columns=columns) if return_matrix else None,
             'high_correlations': high_corr_pairs
         }
     
+    def _ranks(self):
+        """Average ranks of every numeric column (NaNs kept)"""
+        return self._cached('ranks', lambda: self.df[self.numeric_columns].rank(method='average').to_numpy(
+            dtype=np.float64))
+    
     def statistical_summary(self):
         """Generate comprehensive statistical summary"""
+        self._check_frame()
         summary = {}
         
         # Numeric variables
         if self.numeric_columns:
-            numeric_summary = self.df[self.numeric_columns].describe()
-            
-            # Add additional statistics
-            for col in self.numeric_columns:
-                data = self.df[col].dropna()
-                if len(data) > 0:
-                    numeric_summary.loc['skewness', col] = stats.skew(data)
-                    numeric_summary.loc['kurtosis', col] = stats.kurtosis(data)
-                    numeric_summary.loc['median', col] = data.median()
-                    numeric_summary.loc['mode', col] = data.mode().iloc[0] if len(data.mode()) > 0 else np.nan
-            
-            summary['numeric'] = numeric_summary
+            summary['numeric'] = self._numeric_summary().copy()
         
         # Categorical variables
         if self.categorical_columns:
-            categorical_summary = {}
-            for col in self.categorical_columns:
-                value_counts = self.df[col].value_counts()
-                categorical_summary[col] = {
-                    'unique_count': self.df[col].nunique(),
-                    'most_frequent': value_counts.index[0] if len(value_counts) > 0 else None,
-                    'most_frequent_count': value_counts.iloc[0] if len(value_counts) > 0 else 0,
-                    'value_counts': dict(value_counts.head(10))
-                }
-            
-            summary['categorical'] = categorical_summary
+            summary['categorical'] = {col: dict(stats, value_counts=dict(stats['value_counts']))
+                                      for col, stats in self._categorical_summary().items()}
         
         return summary
     
     def feature_engineering_suggestions(self):
         """Suggest feature engineering operations"""
+        self._check_frame()
         suggestions = []
         
         # Check for potential date columns
@@ -142,22 +586,23 @@ class DataAnalyzer:
                     pass
         
         # Check for highly skewed numeric columns
-        for col in self.numeric_columns:
-            data = self.df[col].dropna()
-            if len(data) > 0:
-                skewness = abs(stats.skew(data))
+        if self.numeric_columns:
+            skewness_row = self._numeric_summary().loc['skewness'].abs()
+            for col in self.numeric_columns:
+                skewness = skewness_row[col]
                 if skewness > 2:
                     suggestions.append(f"Column '{col}' is highly skewed (skewness: {skewness:.2f}) - consider log transformation")
         
         # Check for columns with many unique values (potential for binning)
+        unique_counts = self._unique_counts()
         for col in self.numeric_columns:
-            unique_ratio = self.df[col].nunique() / len(self.df)
+            unique_ratio = unique_counts[col] / len(self.df)
             if unique_ratio > 0.9:
                 suggestions.append(f"Column '{col}' has many unique values - consider binning")
         
         # Check for categorical columns with many categories
         for col in self.categorical_columns:
-            unique_count = self.df[col].nunique()
+            unique_count = unique_counts[col]
             if unique_count > 20:
                 suggestions.append(f"Column '{col}' has {unique_count} categories - consider grouping rare categories")
         
@@ -165,14 +610,20 @@ class DataAnalyzer:
     
     def data_quality_report(self):
         """Generate comprehensive data quality report"""
-        report = {
-            'basic_info': self.basic_info(),
-            'missing_values': self.missing_value_analysis(),
-            'outliers': self.outlier_detection(),
-            'correlations': self.correlation_analysis(),
-            'statistical_summary': self.statistical_summary(),
-            'feature_suggestions': self.feature_engineering_suggestions()
-        }
+        # Check the frame once; the sections then share the cached primitives
+        self._check_frame()
+        self._frame_checked = True
+        try:
+            report = {
+                'basic_info': self.basic_info(),
+                'missing_values': self.missing_value_analysis(),
+                'outliers': self.outlier_detection(),
+                'correlations': self.correlation_analysis(),
+                'statistical_summary': self.statistical_summary(),
+                'feature_suggestions': self.feature_engineering_suggestions()
+            }
+        finally:
+            self._frame_checked = False
         
         return report
 
@@ -0,0 +1,173 @@
+import json
+import time
+import threading
+import tracemalloc
+from contextlib import contextmanager
+import pandas as pd
+
+# tracemalloc is process-wide, so sessions and in-flight phases are counted across threads
+_tracing_lock = threading.Lock()
+_tracing_sessions = 0
+_tracing_owned = False
+_active_phases = 0
+
+@contextmanager
+def memory_tracing(enabled=True):
+    """Keep tracemalloc running for the block
+    
+    Sessions are reference counted, so concurrent training calls share one
+    tracing period and none stops it under another. Tracing that was already
+    on (e.g. a benchmark's) is left running.
+    """
+    global _tracing_sessions, _tracing_owned
+    if not enabled:
+        yield
+        return
+    
+    with _tracing_lock:
+        if _tracing_sessions == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_owned = True
+        _tracing_sessions += 1
+    try:
+        yield
+    finally:
+        with _tracing_lock:
+            _tracing_sessions -= 1
+            if _tracing_sessions == 0 and _tracing_owned:
+                tracemalloc.stop()
+                _tracing_owned = False
+
+class PhaseRecorder:
+    """
+    Times the phases of one model's training run and turns them into events
+    
+    Events are plain dicts so they can be returned from worker processes. When
+    emit is set (serial training) each event is also delivered as soon as its
+    phase finishes.
+    """
+    
+    def __init__(self, model_name=None, problem_type=None, trace_memory=False, emit=None):
+        self.model_name = model_name
+        self.problem_type = problem_type
+        self.trace_memory = trace_memory
+        self.emit = emit
+        self.events = []
+    
+    def __getstate__(self):
+        # Callbacks stay in the parent process; workers only collect events
+        state = self.__dict__.copy()
+        state['emit'] = None
+        return state
+    
+    @contextmanager
+    def phase(self, name, **details):
+        """Record wall time, CPU time and peak traced memory growth of a block
+        
+        Traced memory is process-wide: the peak is only reset when no other
+        phase is in flight, so a phase overlapping others (concurrent runs in
+        threads) reports the peak over a window that may include their
+        allocations, as an upper bound.
+        """
+        with memory_tracing(self.trace_memory):
+            memory_start = self._open_memory_window()
+            
+            timestamp = time.time()
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            try:
+                yield
+            finally:
+                wall_time = time.perf_counter() - wall_start
+                cpu_time = time.process_time() - cpu_start
+                peak_memory_delta_mb = self._close_memory_window(memory_start)
+                
+                self.record({
+                    'model_name': self.model_name,
+                    'problem_type': self.problem_type,
+                    'phase': name,
+                    'timestamp': timestamp,
+                    'wall_time': wall_time,
+                    'cpu_time': cpu_time,
+                    'peak_memory_delta_mb': peak_memory_delta_mb,
+                    **details
+                })
+    
+    def _open_memory_window(self):
+        """Traced memory at the start of a phase, resetting the peak if no other phase is in flight"""
+        global _active_phases
+        if not self.trace_memory:
+            return None
+        with _tracing_lock:
+            if _active_phases == 0:
+                tracemalloc.reset_peak()
+            _active_phases += 1
+            return tracemalloc.get_traced_memory()[0]
+    
+    def _close_memory_window(self, memory_start):
+        """Peak traced memory growth in MB since _open_memory_window"""
+        global _active_phases
+        if memory_start is None:
+            return None
+        with _tracing_lock:
+            _active_phases -= 1
+            return (tracemalloc.get_traced_memory()[1] - memory_start) / 1024**2
+    
+    def record(self, event):
+        """Store an event and pass it on to the live callback, if any"""
+        self.events.append(event)
+        if self.emit is not None:
+            self.emit(event)
+
+class TrainingEventCollector:
+    """
+    Training callback that keeps every event for analysis and export
+    
+    Register it with MLModelBuilder.add_callback. With trace_memory=True the
+    builder also measures peak memory growth per phase via tracemalloc, which
+    slows allocation-heavy fits. tracemalloc counts the whole process, so
+    phases running concurrently in other threads can inflate the figures.
+    """
+    
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.events = []
+    
+    def __call__(self, event):
+        self.events.append(event)
+    
+    def clear(self):
+        self.events = []
+    
+    def to_dataframe(self):
+        """All collected events, one row per phase"""
+        columns = ['model_name', 'problem_type', 'phase', 'timestamp', 'wall_time', 'cpu_time',
+                   'peak_memory_delta_mb']
+        df = pd.DataFrame(self.events)
+        if df.empty:
+            return pd.DataFrame(columns=columns)
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
+        return df
+    
+    def summary(self):
+        """Total wall and CPU time and largest memory growth per model and phase"""
+        df = self.to_dataframe()
+        return df.groupby(['model_name', 'phase'], sort=False).agg(
+            wall_time=('wall_time', 'sum'),
+            cpu_time=('cpu_time', 'sum'),
+            peak_memory_delta_mb=('peak_memory_delta_mb', 'max'),
+            calls=('phase', 'size')
+        ).reset_index()
+    
+    def to_jsonl(self, path):
+        """Append the collected events to a JSON lines file"""
+        with open(path, 'a') as f:
+            for event in self.events:
+                f.write(json.dumps(event, default=_json_default) + '\n')
+        return path
+
+def _json_default(value):
+    """Serialise NumPy scalars and other stragglers in event payloads"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
@@ -1,32 +1,776 @@
+import os
+import time
+import json
+import uuid
+import hashlib
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from joblib import Parallel, delayed
 import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV
+from scipy.special import expit
+from sklearn.model_selection import (
+    train_test_split, cross_val_score, GridSearchCV, RandomizedSearchCV, ParameterGrid, check_cv
+)
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingGridSearchCV, HalvingRandomSearchCV
+from sklearn.base import clone, is_classifier
+from sklearn.utils import _safe_indexing
+try:
+    from sklearn.utils import get_tags
+except ImportError:  # scikit-learn < 1.6
+    get_tags = None
+from sklearn.utils.metaestimators import available_if
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor, GradientBoostingClassifier, GradientBoostingRegressor
-from sklearn.linear_model import LogisticRegression, LinearRegression, Ridge, Lasso
+from sklearn.ensemble import HistGradientBoostingClassifier, HistGradientBoostingRegressor
+from sklearn.linear_model import LogisticRegression, LinearRegression, Ridge, Lasso, SGDClassifier, SGDRegressor
+from sklearn.naive_bayes import GaussianNB
 from sklearn.svm import SVC, SVR
-from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
+from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor, NearestNeighbors
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
-from sklearn.cluster import KMeans, DBSCAN, AgglomerativeClustering
+from sklearn.cluster import KMeans, MiniBatchKMeans, DBSCAN, AgglomerativeClustering
+from sklearn.metrics import check_scoring
 from sklearn.metrics import (
-    accuracy_score, precision_score, recall_score, f1_score, 
-    classification_report, confusion_matrix,
+    accuracy_score,
     mean_squared_error, mean_absolute_error, r2_score,
     silhouette_score, adjusted_rand_score
 )
 from sklearn.decomposition import PCA
+from utils.chunked_io import iter_table_chunks
+from utils.model_store import fingerprint_data, fingerprint_estimator, save_model_bundle, load_model_bundle
+from utils.instrumentation import PhaseRecorder, memory_tracing
+from utils.classification_metrics import classification_metrics, metrics_from_confusion
+from utils.shared_data import shared_arrays
 import warnings
 warnings.filterwarnings('ignore')
 
+def _resolve_n_jobs(n_jobs, n_tasks):
+    """Translate an sklearn-style n_jobs value into a worker count"""
+    if n_jobs is None or n_tasks <= 1:
+        return 1
+    if n_jobs < 0:
+        n_jobs = (os.cpu_count() or 1) + 1 + n_jobs
+    return max(1, min(n_jobs, n_tasks))
+
+def _train_single_model(problem_type, model, X_train, X_test, y_train, y_test, single_pass_cv=False,
+                        artifact_store=None, scalers=None, recorder=None, data_fingerprint=None):
+    """Fit and evaluate one model, recording its wall and CPU time
+    
+    Defined at module level so it can be shipped to worker processes. When an
+    artifact_store is given, a previously fitted model for the same data and
+    hyperparameters is loaded instead of refitting; data_fingerprint saves
+    rehashing the training data for every model. Per-phase timings are
+    collected by the PhaseRecorder and returned under 'events'.
+    """
+    if recorder is None:
+        recorder = PhaseRecorder(problem_type=problem_type)
+    
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    scoring = 'accuracy' if problem_type == 'classification' else 'r2'
+    
+    fit_state = None
+    if artifact_store is not None:
+        with recorder.phase('cache_lookup'):
+            cache_key = artifact_store.make_key(model, X_train, y_train, data_fingerprint, scoring=scoring,
+                                                single_pass_cv=single_pass_cv)
+            fit_state = artifact_store.get(cache_key)
+    
+    from_cache = fit_state is not None
+    if not from_cache:
+        fit_state = _fit_and_cross_validate(model, X_train, y_train, scoring, single_pass_cv, recorder)
+        if artifact_store is not None:
+            with recorder.phase('cache_store'):
+                fit_state['scalers'] = dict(scalers or {})
+                artifact_store.put(cache_key, fit_state)
+    
+    if problem_type == 'classification':
+        result = _classification_metrics(fit_state['model'], X_test, y_test, recorder)
+    else:
+        result = _regression_metrics(fit_state['model'], X_test, y_test, recorder)
+    
+    cv_scores = fit_state['cv_scores']
+    result['cv_mean'] = cv_scores.mean()
+    result['cv_std'] = cv_scores.std()
+    
+    if single_pass_cv:
+        result['oof_predictions'] = fit_state['oof_predictions']
+        if problem_type == 'classification':
+            result['oof_probabilities'] = fit_state['oof_probabilities']
+        result['fold_models'] = fit_state['fold_models']
+    
+    if artifact_store is not None:
+        result['from_cache'] = from_cache
+        result['scalers'] = fit_state.get('scalers', {})
+    
+    result['wall_time'] = time.perf_counter() - wall_start
+    result['cpu_time'] = time.process_time() - cpu_start
+    recorder.record({
+        'model_name': recorder.model_name,
+        'problem_type': problem_type,
+        'phase': 'total',
+        'timestamp': time.time() - result['wall_time'],
+        'wall_time': result['wall_time'],
+        'cpu_time': result['cpu_time'],
+        'peak_memory_delta_mb': None
+    })
+    result['events'] = recorder.events
+    return result
+
+def _fit_and_cross_validate(model, X_train, y_train, scoring, single_pass_cv=False, recorder=None):
+    """Fit a model and collect its cross-validation scores"""
+    recorder = recorder or PhaseRecorder()
+    
+    if single_pass_cv:
+        # Fit the folds once; their ensemble stands in for the full-data refit
+        with recorder.phase('cross_validation', single_pass=True):
+            cv_run = CrossValidationEngine(cv=5, scoring=scoring).run(model, X_train, y_train)
+        final_model = FoldEnsemble(cv_run['fold_models'], cv_run['classes'])
+        
+        if isinstance(model, LAZY_LEARNERS):
+            # Their fit only stores the data while every predict costs a neighbour search,
+            # so one full-data model is far cheaper to keep than five fold models
+            with recorder.phase('fit'):
+                final_model = model.fit(X_train, y_train)
+        
+        return {
+            'model': final_model,
+            'cv_scores': cv_run['fold_scores'],
+            'oof_predictions': cv_run['oof_predictions'],
+            'oof_probabilities': cv_run['oof_probabilities'],
+            'fold_models': cv_run['fold_models']
+        }
+    
+    # Train the model
+    with recorder.phase('fit'):
+        model.fit(X_train, y_train)
+    
+    # Cross-validation score
+    with recorder.phase('cross_validation', single_pass=False):
+        cv_scores = cross_val_score(model, X_train, y_train, cv=5, scoring=scoring)
+    
+    return {
+        'model': model,
+        'cv_scores': cv_scores
+    }
+
+def _classification_metrics(model, X_test, y_test, recorder=None):
+    """Compute holdout metrics for a fitted classifier"""
+    recorder = recorder or PhaseRecorder()
+    
+    # Make predictions
+    with recorder.phase('predict'):
+        y_pred = model.predict(X_test)
+    y_pred_proba = None
+    if hasattr(model, 'predict_proba'):
+        with recorder.phase('predict_proba'):
+            y_pred_proba = model.predict_proba(X_test)
+    
+    # Calculate metrics
+    with recorder.phase('metrics'):
+        # One confusion matrix pass yields accuracy, weighted scores and the report
+        metrics = classification_metrics(y_test, y_pred)
+    
+    return {
+        'model': model,
+        'predictions': y_pred,
+        'probabilities': y_pred_proba,
+        'accuracy': metrics['accuracy'],
+        'precision': metrics['precision'],
+        'recall': metrics['recall'],
+        'f1_score': metrics['f1_score'],
+        'classification_report': metrics['classification_report'],
+        'confusion_matrix': metrics['confusion_matrix']
+    }
+
+def _regression_metrics(model, X_test, y_test, recorder=None):
+    """Compute holdout metrics for a fitted regressor"""
+    recorder = recorder or PhaseRecorder()
+    
+    # Make predictions
+    with recorder.phase('predict'):
+        y_pred = model.predict(X_test)
+    
+    # Calculate metrics
+    with recorder.phase('metrics'):
+        mse = mean_squared_error(y_test, y_pred)
+        mae = mean_absolute_error(y_test, y_pred)
+        r2 = r2_score(y_test, y_pred)
+        rmse = np.sqrt(mse)
+    
+    return {
+        'model': model,
+        'predictions': y_pred,
+        'mse': mse,
+        'mae': mae,
+        'r2_score': r2,
+        'rmse': rmse
+    }
+
+# Models whose fit is cheap next to predict; single_pass_cv refits these instead of keeping the fold ensemble
+LAZY_LEARNERS = (KNeighborsClassifier, KNeighborsRegressor)
+
+class CrossValidationEngine:
+    """
+    Single-pass k-fold runner that keeps fold estimators and out-of-fold predictions
+    """
+    
+    # Prediction-based scorers, so fold scores come from the stored OOF predictions
+    SCORERS = {
+        'accuracy': accuracy_score,
+        'r2': r2_score,
+        'neg_mean_squared_error': lambda y_true, y_pred: -mean_squared_error(y_true, y_pred),
+        'neg_mean_absolute_error': lambda y_true, y_pred: -mean_absolute_error(y_true, y_pred)
+    }
+    
+    def __init__(self, cv=5, scoring='accuracy'):
+        if scoring not in self.SCORERS:
+            raise ValueError(f"Scoring must be one of {list(self.SCORERS)}")
+        self.cv = cv
+        self.scoring = scoring
+    
+    def run(self, model, X, y):
+        """Fit a clone of model on every fold and collect OOF predictions and scores"""
+        classifier = is_classifier(model)
+        splitter = check_cv(self.cv, y, classifier=classifier)
+        y_values = np.asarray(y)
+        
+        classes = np.unique(y_values) if classifier else None
+        # Regressors predict floats even for an integer target
+        oof_predictions = np.empty(len(y_values), dtype=y_values.dtype if classifier else np.float64)
+        oof_probabilities = None
+        if classifier and hasattr(model, 'predict_proba'):
+            oof_probabilities = np.zeros((len(y_values), len(classes)))
+        
+        fold_models = []
+        fold_scores = []
+        for train_idx, val_idx in splitter.split(X, y_values):
+            fold_model = clone(model)
+            fold_model.fit(_safe_indexing(X, train_idx), y_values[train_idx])
+            
+            X_val = _safe_indexing(X, val_idx)
+            if oof_probabilities is not None and isinstance(fold_model, LAZY_LEARNERS):
+                # Neighbour votes give the label too, saving a second neighbour search
+                oof_probabilities[val_idx] = _align_probabilities(fold_model, X_val, classes)
+                fold_pred = classes[np.argmax(oof_probabilities[val_idx], axis=1)]
+            else:
+                fold_pred = fold_model.predict(X_val)
+                if oof_probabilities is not None:
+                    oof_probabilities[val_idx] = _align_probabilities(fold_model, X_val, classes)
+            oof_predictions[val_idx] = fold_pred
+            
+            fold_scores.append(self.SCORERS[self.scoring](y_values[val_idx], fold_pred))
+            fold_models.append(fold_model)
+        
+        return {
+            'fold_models': fold_models,
+            'fold_scores': np.array(fold_scores),
+            'oof_predictions': oof_predictions,
+            'oof_probabilities': oof_probabilities,
+            'classes': classes
+        }
+
+class FoldEnsemble:
+    """
+    Averages the fold estimators from a CrossValidationEngine run into one predictor
+    
+    Every predict runs all fold estimators, so scoring costs k times that of a
+    single model.
+    """
+    
+    def __init__(self, fold_models, classes=None):
+        self.fold_models = fold_models
+        self.classes_ = classes
+        
+        # Same input checks as the fold estimators (serving, scoring) rely on
+        if fold_models and hasattr(fold_models[0], 'n_features_in_'):
+            self.n_features_in_ = fold_models[0].n_features_in_
+        if fold_models and hasattr(fold_models[0], 'feature_names_in_'):
+            self.feature_names_in_ = fold_models[0].feature_names_in_
+    
+    def predict(self, X):
+        """Average regressors, or combine classifiers by soft or majority vote"""
+        if self.classes_ is None:
+            return np.mean([model.predict(X) for model in self.fold_models], axis=0)
+        
+        if hasattr(self, 'predict_proba'):
+            return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+        
+        votes = np.zeros((_num_samples(X), len(self.classes_)))
+        rows = np.arange(votes.shape[0])
+        for model in self.fold_models:
+            votes[rows, np.searchsorted(self.classes_, model.predict(X))] += 1
+        return self.classes_[np.argmax(votes, axis=1)]
+    
+    @available_if(lambda self: self.classes_ is not None and all(
+        hasattr(model, 'predict_proba') for model in self.fold_models))
+    def predict_proba(self, X):
+        """Mean class probabilities across the fold estimators"""
+        return np.mean([_align_probabilities(model, X, self.classes_) for model in self.fold_models], axis=0)
+    
+    @property
+    def feature_importances_(self):
+        """Mean feature importances across the fold estimators"""
+        if not all(hasattr(model, 'feature_importances_') for model in self.fold_models):
+            raise AttributeError("Fold estimators do not expose feature_importances_")
+        return np.mean([model.feature_importances_ for model in self.fold_models], axis=0)
+
+def _align_probabilities(model, X, classes):
+    """Return predict_proba columns aligned to classes, even if a fold missed one"""
+    proba = model.predict_proba(X)
+    if len(model.classes_) == len(classes):
+        return proba
+    aligned = np.zeros((proba.shape[0], len(classes)))
+    aligned[:, np.searchsorted(classes, model.classes_)] = proba
+    return aligned
+
+def _allows_nan(model):
+    """Whether the estimator accepts missing values in X (e.g. histogram boosting, trees)"""
+    if get_tags is not None:
+        return get_tags(model).input_tags.allow_nan
+    return model._get_tags().get('allow_nan', False)
+
+def _has_missing(X):
+    """Whether a feature matrix or DataFrame contains NaN"""
+    if isinstance(X, pd.DataFrame):
+        return bool(X.isna().to_numpy().any())
+    X = np.asarray(X)
+    return X.dtype.kind == 'f' and bool(np.isnan(X).any())
+
+def _impute_train_means(X_train, X_test):
+    """Copies of X_train and X_test with NaNs replaced by the training column means"""
+    if isinstance(X_train, pd.DataFrame):
+        means = X_train.mean()
+        return X_train.fillna(means), X_test.fillna(means)
+    means = np.nan_to_num(np.nanmean(X_train, axis=0))
+    return np.where(np.isnan(X_train), means, X_train), np.where(np.isnan(X_test), means, X_test)
+
+def _num_samples(X):
+    """Number of rows in an array-like"""
+    return X.shape[0] if hasattr(X, 'shape') else len(X)
+
+def score_chunk(model, X, scaler=None, output='both'):
+    """Score one block of rows, returning (predictions, probabilities)
+    
+    The rows are scaled on a private float copy and passed to the model as a
+    plain array, without rebuilding a DataFrame.
+    """
+    if output not in ('both', 'labels', 'proba'):
+        raise ValueError("output must be 'both', 'labels' or 'proba'")
+    
+    X_values = np.array(X, dtype=np.float64)
+    if scaler is not None:
+        X_values = scaler.transform(X_values, copy=False)
+    
+    predictions = None
+    probabilities = None
+    if output in ('both', 'labels'):
+        predictions = model.predict(X_values)
+    if output in ('both', 'proba') and hasattr(model, 'predict_proba'):
+        probabilities = model.predict_proba(X_values)
+    
+    return predictions, probabilities
+
+def _slice_rows(X, start, stop):
+    """Positional row slice for DataFrames and arrays"""
+    return X.iloc[start:stop] if hasattr(X, 'iloc') else X[start:stop]
+
+def _allocate_prediction_buffers(model, n_rows, output):
+    """Preallocate the label and probability outputs for a batched scoring run"""
+    if output == 'proba' and not hasattr(model, 'predict_proba'):
+        raise ValueError("Model does not support probability predictions")
+    
+    classes = getattr(model, 'classes_', None)
+    
+    predictions = None
+    if output in ('both', 'labels'):
+        predictions = np.empty(n_rows, dtype=classes.dtype if classes is not None else np.float64)
+    
+    probabilities = None
+    if output in ('both', 'proba') and hasattr(model, 'predict_proba'):
+        probabilities = np.empty((n_rows, len(classes)))
+    
+    return predictions, probabilities
+
+_worker_model = None
+_worker_scaler = None
+
+def _init_scoring_worker(model, scaler):
+    """Ship the model and scaler to a worker process once"""
+    global _worker_model, _worker_scaler
+    _worker_model = model
+    _worker_scaler = scaler
+
+def _score_worker_chunk(start, X_chunk, output):
+    """Score a chunk inside a worker process initialised by _init_scoring_worker"""
+    predictions, probabilities = score_chunk(_worker_model, X_chunk, _worker_scaler, output)
+    return start, predictions, probabilities
+
+def _score_chunks_in_pool(model, scaler, X, starts, batch_size, output, n_workers):
+    """Yield scored chunks from a process pool, keeping only a few chunks in flight"""
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_scoring_worker,
+                             initargs=(model, scaler)) as executor:
+        pending = []
+        for start in starts:
+            X_chunk = _slice_rows(X, start, start + batch_size)
+            pending.append(executor.submit(_score_worker_chunk, start, X_chunk, output))
+            if len(pending) >= 2 * n_workers:
+                yield pending.pop(0).result()
+        
+        for future in pending:
+            yield future.result()
+
+class _StreamingMetrics:
+    """
+    Accumulates holdout metrics chunk by chunk for train_incremental
+    """
+    
+    def __init__(self, problem_type, classes=None):
+        self.problem_type = problem_type
+        self.classes = classes
+        self.n_rows = 0
+        if problem_type == 'classification':
+            self.confusion = np.zeros((len(classes), len(classes)), dtype=np.int64)
+        else:
+            # Squared error, absolute error and inertia
+            self.sums = np.zeros(3)
+            
+            # Count, mean and sum of squared deviations of the target, for the total sum of squares
+            self.y_moments = (0, 0.0, 0.0)
+    
+    def update(self, model, X, y=None):
+        """Score one held-out chunk"""
+        self.n_rows += len(X)
+        
+        if self.problem_type == 'classification':
+            n_classes = len(self.classes)
+            true_idx = np.searchsorted(self.classes, y)
+            pred_idx = np.searchsorted(self.classes, model.predict(X))
+            self.confusion += np.bincount(true_idx * n_classes + pred_idx,
+                                          minlength=n_classes ** 2).reshape(n_classes, n_classes)
+        elif self.problem_type == 'regression':
+            y = np.asarray(y, dtype=np.float64)
+            error = y - model.predict(X)
+            self.sums += [(error ** 2).sum(), np.abs(error).sum(), 0]
+            self._update_target_moments(y)
+        else:
+            # MiniBatchKMeans.score is the negative inertia of the chunk
+            self.sums[2] -= model.score(X)
+    
+    def _update_target_moments(self, y):
+        """Merge the chunk's count, mean and M2 into the target moments (pairwise update, no cancellation)"""
+        if len(y) == 0:
+            return
+        n_a, mean_a, m2_a = self.y_moments
+        n_b = len(y)
+        mean_b = y.mean()
+        m2_b = ((y - mean_b) ** 2).sum()
+        
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        self.y_moments = (n, mean_a + delta * n_b / n, m2_a + m2_b + delta ** 2 * n_a * n_b / n)
+    
+    def result(self):
+        """Final metrics in the same vocabulary as the in-memory train methods"""
+        n = max(self.n_rows, 1)
+        
+        if self.problem_type == 'classification':
+            metrics = metrics_from_confusion(self.confusion, np.asarray(self.classes))
+            return {
+                'accuracy': metrics['accuracy'],
+                'precision': metrics['precision'],
+                'recall': metrics['recall'],
+                'f1_score': metrics['f1_score'],
+                'classification_report': metrics['classification_report'],
+                'confusion_matrix': self.confusion,
+                'n_test_rows': self.n_rows
+            }
+        
+        if self.problem_type == 'regression':
+            sse, sae, _ = self.sums
+            total_ss = self.y_moments[2]
+            mse = sse / n
+            return {
+                'mse': mse,
+                'mae': sae / n,
+                'r2_score': 1 - sse / total_ss if total_ss > 0 else 0.0,
+                'rmse': np.sqrt(mse),
+                'n_test_rows': self.n_rows
+            }
+        
+        return {
+            'inertia': self.sums[2],
+            'n_test_rows': self.n_rows
+        }
+
+def _fit_kmeans(X, n_clusters, mini_batch=False, silhouette_sample_size=None, init_centers=None):
+    """Fit one (MiniBatch)KMeans for the k sweep in perform_clustering"""
+    estimator = MiniBatchKMeans if mini_batch else KMeans
+    if init_centers is not None:
+        model = estimator(n_clusters=n_clusters, init=init_centers, n_init=1, random_state=42)
+    else:
+        model = estimator(n_clusters=n_clusters, random_state=42)
+    cluster_labels = model.fit_predict(X)
+    
+    # Calculate silhouette score
+    silhouette_avg = _silhouette(X, cluster_labels, silhouette_sample_size)
+    
+    return {
+        'model': model,
+        'labels': cluster_labels,
+        'n_clusters': n_clusters,
+        'silhouette_score': silhouette_avg,
+        'inertia': model.inertia_
+    }
+
+def _silhouette(X, labels, sample_size=None):
+    """Silhouette score, estimated on a random sample when sample_size is set"""
+    if sample_size is not None and sample_size < len(labels):
+        return silhouette_score(X, labels, sample_size=sample_size, random_state=42)
+    return silhouette_score(X, labels)
+
+def _grow_centers(X, model):
+    """Warm-start centroids for k + 1: the fitted centers plus the worst-served point"""
+    distances = model.transform(X).min(axis=1)
+    new_center = X[np.argmax(distances)]
+    return np.unique(np.vstack([model.cluster_centers_, new_center]), axis=0)
+
+_worker_X = None
+
+def _init_clustering_worker(X):
+    """Ship the scaled clustering matrix to a worker process once"""
+    global _worker_X
+    _worker_X = X
+
+def _fit_kmeans_worker(n_clusters, mini_batch, silhouette_sample_size):
+    """Fit one k of the sweep inside a worker initialised by _init_clustering_worker"""
+    return _fit_kmeans(_worker_X, n_clusters, mini_batch, silhouette_sample_size)
+
+def estimate_dbscan_eps(X, min_samples=5):
+    """Pick a DBSCAN eps at the knee of the sorted k-distance curve"""
+    algorithm = 'kd_tree' if X.shape[1] <= 20 else 'ball_tree'
+    distances, _ = NearestNeighbors(n_neighbors=min_samples, algorithm=algorithm).fit(X).kneighbors(X)
+    k_distances = np.sort(distances[:, -1])
+    
+    # Knee = point farthest from the chord joining the curve's endpoints
+    x = np.linspace(0, 1, len(k_distances))
+    span = k_distances[-1] - k_distances[0]
+    if span <= 0:
+        return float(k_distances[-1]) or 0.5
+    y = (k_distances - k_distances[0]) / span
+    return float(k_distances[np.argmax(x - y)])
+
+class CompiledTreeEnsemble:
+    """
+    Fitted tree model flattened into contiguous node arrays with a vectorized predictor
+    
+    Supports decision trees, random forests and gradient boosting (classifiers
+    and single-output regressors). Trees are traversed level by level for all
+    rows and trees at once, and leaf values are accumulated in the same order
+    as sklearn so the outputs match the source model. Working memory grows with
+    rows x trees, so score large inputs through predict_new_data_batched.
+    """
+    
+    def __init__(self, model):
+        if isinstance(model, (DecisionTreeClassifier, DecisionTreeRegressor)):
+            self.kind = 'tree'
+            trees = [model]
+        elif isinstance(model, (RandomForestClassifier, RandomForestRegressor)):
+            self.kind = 'forest'
+            trees = list(model.estimators_)
+        elif isinstance(model, (GradientBoostingClassifier, GradientBoostingRegressor)):
+            if model.init not in (None, 'zero'):
+                raise ValueError("Only gradient boosting with the default or 'zero' init can be compiled")
+            self.kind = 'boosting'
+            trees = list(model.estimators_.ravel())
+        else:
+            raise ValueError(f"Cannot compile {type(model).__name__}; expected a tree, forest or gradient boosting model")
+        
+        if getattr(model, 'n_outputs_', 1) != 1:
+            raise ValueError("Only single-output tree models can be compiled")
+        
+        self.classes_ = getattr(model, 'classes_', None)
+        self.n_features_in_ = model.n_features_in_
+        self.is_classifier = is_classifier(model)
+        
+        offsets = np.cumsum([0] + [tree.tree_.node_count for tree in trees])
+        self.roots = offsets[:-1].astype(np.intp)
+        self.max_depth = max(tree.tree_.max_depth for tree in trees)
+        
+        features, thresholds, lefts, rights, missing_left, values = [], [], [], [], [], []
+        for offset, tree in zip(offsets, trees):
+            nodes = tree.tree_.__getstate__()['nodes']
+            node_ids = np.arange(len(nodes)) + offset
+            is_leaf = nodes['left_child'] == -1
+            
+            # Leaves point at themselves so extra traversal steps are no-ops
+            features.append(np.where(is_leaf, 0, nodes['feature']))
+            thresholds.append(nodes['threshold'])
+            lefts.append(np.where(is_leaf, node_ids, nodes['left_child'] + offset))
+            rights.append(np.where(is_leaf, node_ids, nodes['right_child'] + offset))
+            if 'missing_go_to_left' in nodes.dtype.names:
+                missing_left.append(nodes['missing_go_to_left'].astype(bool))
+            else:
+                missing_left.append(np.zeros(len(nodes), dtype=bool))
+            
+            value = tree.tree_.value[:, 0, :]
+            if self.kind != 'boosting' and self.is_classifier:
+                # Same normalisation as DecisionTreeClassifier.predict_proba
+                normalizer = value.sum(axis=1, keepdims=True)
+                normalizer[normalizer == 0.0] = 1.0
+                value = value / normalizer
+            values.append(value)
+        
+        self.feature = np.ascontiguousarray(np.concatenate(features), dtype=np.intp)
+        self.threshold = np.ascontiguousarray(np.concatenate(thresholds), dtype=np.float64)
+        self.left = np.ascontiguousarray(np.concatenate(lefts), dtype=np.intp)
+        self.right = np.ascontiguousarray(np.concatenate(rights), dtype=np.intp)
+        self.missing_go_to_left = np.concatenate(missing_left)
+        self.value = np.ascontiguousarray(np.concatenate(values), dtype=np.float64)
+        
+        if self.kind == 'boosting':
+            n_groups = model.estimators_.shape[1]
+            self.learning_rate = model.learning_rate
+            self.raw_init = model._raw_predict_init(np.zeros((1, self.n_features_in_)))[0].astype(np.float64)
+            self.n_raw_outputs = n_groups
+    
+    @property
+    def nbytes(self):
+        """Memory held by the node arrays"""
+        return sum(array.nbytes for array in (
+            self.feature, self.threshold, self.left, self.right, self.missing_go_to_left, self.value
+        ))
+    
+    def apply(self, X):
+        """Leaf node index (into the flattened arrays) for every row and tree"""
+        # sklearn compares float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], len(self.roots))).copy()
+        for _ in range(self.max_depth):
+            x = X[rows, self.feature[nodes]]
+            go_left = np.where(np.isnan(x), self.missing_go_to_left[nodes], x <= self.threshold[nodes])
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+    
+    def _predict_values(self, X):
+        """Aggregated leaf values: class probabilities, regression values or raw boosting scores"""
+        leaves = self.apply(X)
+        leaf_values = self.value[leaves]
+        
+        # cumsum adds tree by tree, matching sklearn's accumulation order exactly
+        if self.kind == 'boosting':
+            n_rows = leaves.shape[0]
+            contributions = self.learning_rate * leaf_values[:, :, 0].reshape(n_rows, -1, self.n_raw_outputs)
+            init = np.broadcast_to(self.raw_init, (n_rows, 1, self.n_raw_outputs))
+            return np.cumsum(np.concatenate([init, contributions], axis=1), axis=1)[:, -1, :]
+        
+        total = np.cumsum(leaf_values, axis=1)[:, -1, :]
+        if self.kind == 'forest':
+            total /= leaves.shape[1]
+        return total
+    
+    def _boosting_proba(self, raw):
+        """Turn raw boosting scores into class probabilities"""
+        if raw.shape[1] == 1:
+            proba = np.empty((raw.shape[0], 2))
+            proba[:, 1] = expit(raw[:, 0])
+            proba[:, 0] = 1 - proba[:, 1]
+            return proba
+        raw = raw - raw.max(axis=1, keepdims=True)
+        exp_raw = np.exp(raw)
+        return exp_raw / exp_raw.sum(axis=1, keepdims=True)
+    
+    @available_if(lambda self: self.is_classifier)
+    def predict_proba(self, X):
+        """Class probabilities for rows of X"""
+        values = self._predict_values(X)
+        return self._boosting_proba(values) if self.kind == 'boosting' else values
+    
+    def predict(self, X):
+        """Predicted labels or values for rows of X"""
+        if self.is_classifier:
+            return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+        
+        values = self._predict_values(X)
+        return values[:, 0]
+
+def _progressive_sizes(n_samples, initial_size, growth_factor):
+    """Geometric training-set sizes from initial_size up to and including n_samples"""
+    sizes = []
+    size = min(int(initial_size), n_samples)
+    while size < n_samples:
+        sizes.append(size)
+        size = int(np.ceil(size * growth_factor))
+    sizes.append(n_samples)
+    return sizes
+
+def _stratified_subsample(y, size, problem_type, random_state=42):
+    """Positions of a subsample of size rows, stratified on y for classification"""
+    n_samples = _num_samples(y)
+    if size >= n_samples:
+        return np.arange(n_samples)
+    
+    positions = np.arange(n_samples)
+    if problem_type == 'classification':
+        try:
+            sample, _ = train_test_split(positions, train_size=size, random_state=random_state,
+                                         stratify=np.asarray(y))
+            return np.sort(sample)
+        except ValueError:
+            # Too few rows for every class to be represented; fall back to a plain random sample
+            pass
+    
+    rng = np.random.default_rng(random_state)
+    return np.sort(rng.choice(n_samples, size=size, replace=False))
+
+class TrainingRun:
+    """
+    Run-scoped models, results and scalers for one training session
+    
+    Pass the same run to prepare_data, the train methods and the prediction
+    helpers to keep a session's state out of the builder's shared registries.
+    """
+    
+    def __init__(self, run_id=None):
+        self.run_id = run_id or uuid.uuid4().hex
+        self.models = {}
+        self.results = {}
+        self.scalers = {}
+        self.compiled_models = {}
+        self.feature_metadata = {}
+        
+        # (data fingerprint, radius, sparse graph) of the last DBSCAN neighbor search
+        self.neighbor_graph_cache = None
+
 class MLModelBuilder:
     """
     Comprehensive machine learning model builder and evaluator
     """
     
-    def __init__(self):
+    def __init__(self, artifact_store=None):
         self.models = {}
         self.results = {}
         self.scalers = {}
+        self.compiled_models = {}
+        self.feature_metadata = {}
+        
+        # (data fingerprint, radius, sparse graph) of the last DBSCAN neighbor search
+        self.neighbor_graph_cache = None
+        
+        # Callables receiving one structured event dict per training phase
+        self.callbacks = []
+        
+        # Guards the shared registries so one builder can serve concurrent sessions
+        self._lock = threading.RLock()
+        
+        # Optional ModelArtifactStore consulted before fitting
+        self.artifact_store = artifact_store
         
         # Define available models
         self.classification_models = {
@@ -54,13 +798,90 @@ class MLModelBuilder:
             'DBSCAN': DBSCAN(),
             'Agglomerative': AgglomerativeClustering()
         }
+        
+        # Histogram-binned boosting with early stopping, swapped in by engine='fast'
+        self.fast_engine_models = {
+            'classification': {
+                'Gradient Boosting': HistGradientBoostingClassifier(
+                    early_stopping=True, validation_fraction=0.1, n_iter_no_change=10, random_state=42
+                )
+            },
+            'regression': {
+                'Gradient Boosting': HistGradientBoostingRegressor(
+                    early_stopping=True, validation_fraction=0.1, n_iter_no_change=10, random_state=42
+                )
+            }
+        }
+        
+        # Estimators supporting partial_fit, used by train_incremental
+        self.incremental_models = {
+            'classification': {
+                'SGD Classifier': SGDClassifier(random_state=42),
+                'Naive Bayes': GaussianNB()
+            },
+            'regression': {
+                'SGD Regressor': SGDRegressor(random_state=42)
+            },
+            'clustering': {
+                'MiniBatchKMeans': MiniBatchKMeans(n_clusters=3, random_state=42, n_init=3)
+            }
+        }
+    
+    def start_run(self, run_id=None):
+        """Create a TrainingRun to isolate one session's models and results"""
+        return TrainingRun(run_id)
+    
+    def _scope(self, run=None):
+        """Where state lives for a call: the given run, or the builder's shared registries"""
+        return self if run is None else run
+    
+    def _get_model(self, model_name, run=None):
+        """Look up a trained model and the feature scaler for a run (or the shared registry)"""
+        scope = self._scope(run)
+        with self._lock:
+            if model_name not in scope.models:
+                raise ValueError(f"Model {model_name} not found. Train the model first.")
+            return scope.models[model_name], scope.scalers.get('feature_scaler')
     
-    def prepare_data(self, df, target_column, feature_columns=None, test_size=0.2, scale_features=True):
-        """Prepare data for machine learning"""
+    def add_callback(self, callback):
+        """Register a callable that receives training events (see TrainingEventCollector)"""
+        with self._lock:
+            self.callbacks.append(callback)
+        return callback
+    
+    def remove_callback(self, callback):
+        """Stop sending training events to callback"""
+        with self._lock:
+            self.callbacks.remove(callback)
+    
+    def _emit(self, event):
+        """Deliver one training event to every registered callback"""
+        with self._lock:
+            callbacks = list(self.callbacks)
+        for callback in callbacks:
+            callback(event)
+    
+    def prepare_data(self, df, target_column, feature_columns=None, test_size=0.2, scale_features=True,
+                     impute_missing=True, run=None, dtype=None, memory_report=False):
+        """Prepare data for machine learning
+        
+        Set impute_missing=False to keep NaNs for models that handle them
+        natively, such as the engine='fast' gradient boosting; the train methods
+        impute with training means for the other models. Passing a dtype
+        (e.g. np.float32) switches to the memory-lean path, which returns NumPy
+        arrays and stores the index/column metadata in feature_metadata. With
+        memory_report it also runs the DataFrame path on the same input and
+        stores both measured peaks (via tracemalloc) and their difference in
+        feature_metadata['memory'].
+        """
         if feature_columns is None:
             feature_columns = [col for col in df.select_dtypes(include=[np.number]).columns 
                              if col != target_column]
         
+        if dtype is not None:
+            return self._prepare_data_compact(df, target_column, feature_columns, test_size, scale_features,
+                                              impute_missing, run, dtype, memory_report)
+        
         # Remove rows with missing target values
         df_clean = df.dropna(subset=[target_column])
         
@@ -69,7 +890,8 @@ class MLModelBuilder:
         y = df_clean[target_column].copy()
         
         # Handle missing values in features
-        X = X.fillna(X.mean() if X.select_dtypes(include=[np.number]).shape[1] > 0 else 0)
+        if impute_missing:
+            X = X.fillna(X.mean() if X.select_dtypes(include=[np.number]).shape[1] > 0 else 0)
         
         # Split the data
         X_train, X_test, y_train, y_test = train_test_split(
@@ -85,10 +907,85 @@ class MLModelBuilder:
             X_train = pd.DataFrame(X_train_scaled, columns=X_train.columns, index=X_train.index)
             X_test = pd.DataFrame(X_test_scaled, columns=X_test.columns, index=X_test.index)
             
-            self.scalers['feature_scaler'] = scaler
+            with self._lock:
+                self._scope(run).scalers['feature_scaler'] = scaler
+        
+        return X_train, X_test, y_train, y_test
+    
+    def _prepare_data_compact(self, df, target_column, feature_columns, test_size, scale_features,
+                              impute_missing, run, dtype, memory_report=False):
+        """Build one contiguous feature matrix of the given dtype, then impute, split and scale in place"""
+        recorder = PhaseRecorder(trace_memory=memory_report)
+        if memory_report:
+            # Baseline: the DataFrame path on the same input, in a throwaway run and with its output dropped
+            with recorder.phase('prepare_data_default'):
+                self.prepare_data(df, target_column, feature_columns, test_size, scale_features, impute_missing,
+                                  run=TrainingRun())
+        
+        with recorder.phase('prepare_data'):
+            X_train, X_test, y_train, y_test, index, train_idx, test_idx = self._build_compact_matrix(
+                df, target_column, feature_columns, test_size, scale_features, impute_missing, run, dtype
+            )
+        
+        metadata = {
+            'columns': list(feature_columns),
+            'train_index': index[train_idx],
+            'test_index': index[test_idx],
+            'dtype': np.dtype(dtype)
+        }
+        if memory_report:
+            default_peak_mb, peak_mb = [event['peak_memory_delta_mb'] for event in recorder.events]
+            metadata['memory'] = {
+                'matrix_mb': (X_train.nbytes + X_test.nbytes) / 1024**2,
+                'peak_mb': peak_mb,
+                'default_peak_mb': default_peak_mb,
+                'saved_mb': default_peak_mb - peak_mb
+            }
+        with self._lock:
+            self._scope(run).feature_metadata = metadata
         
         return X_train, X_test, y_train, y_test
     
+    def _build_compact_matrix(self, df, target_column, feature_columns, test_size, scale_features,
+                              impute_missing, run, dtype):
+        """Split and scaled arrays for _prepare_data_compact, plus the kept index and split positions"""
+        # Remove rows with missing target values without copying the frame
+        keep = df[target_column].notna().to_numpy()
+        y = df[target_column].to_numpy()[keep]
+        index = df.index[keep]
+        
+        # Fill the matrix column by column so only one column is ever converted at a time
+        X = np.empty((len(y), len(feature_columns)), dtype=dtype)
+        for j, col in enumerate(feature_columns):
+            X[:, j] = df[col].to_numpy()[keep]
+        
+        # Handle missing values in features
+        if impute_missing:
+            nan_rows, nan_cols = np.nonzero(np.isnan(X))
+            if len(nan_rows) > 0:
+                X[nan_rows, nan_cols] = np.nanmean(X, axis=0)[nan_cols]
+        
+        # Split the data (same rows as the DataFrame path for the same random_state)
+        train_idx, test_idx = train_test_split(
+            np.arange(len(y)), test_size=test_size, random_state=42,
+            stratify=y if self._is_classification(y) else None
+        )
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y[train_idx], y[test_idx]
+        del X
+        
+        # Scale features in place
+        if scale_features:
+            scaler = StandardScaler(copy=False)
+            scaler.fit(X_train)
+            scaler.transform(X_train, copy=False)
+            scaler.transform(X_test, copy=False)
+            
+            with self._lock:
+                self._scope(run).scalers['feature_scaler'] = scaler
+        
+        return X_train, X_test, y_train, y_test, index, train_idx, test_idx
+    
     def _is_classification(self, y):
         """Determine if the problem is classification or regression"""
         unique_values = len(np.unique(y))
@@ -97,102 +994,329 @@ class MLModelBuilder:
         # If less than 20 unique values or if unique values are less than 5% of total
         return unique_values < 20 or (unique_values / total_values) < 0.05
     
-    def train_classification_models(self, X_train, X_test, y_train, y_test, models_to_train=None):
-        """Train multiple classification models"""
+    def train_classification_models(self, X_train, X_test, y_train, y_test, models_to_train=None, n_jobs=1,
+                                    single_pass_cv=False, engine='standard', run=None):
+        """Train multiple classification models
+        
+        Set n_jobs to a worker count (or -1 for all cores) to train the models
+        in parallel across a process pool. With single_pass_cv the 5 CV folds
+        are fitted once and their ensemble is used for the holdout metrics.
+        The ensemble runs all 5 fold models on every predict, so prediction-heavy
+        models can end up slower overall; nearest-neighbour models are refitted
+        on the full training set instead.
+        engine='fast' trains 'Gradient Boosting' as histogram-based boosting
+        with early stopping and native missing-value support. Pass a TrainingRun
+        as run to keep the fitted models and results out of the shared registries.
+        """
+        model_registry = self._model_registry('classification', engine)
+        
         if models_to_train is None:
-            models_to_train = list(self.classification_models.keys())
+            models_to_train = list(model_registry.keys())
         
-        results = {}
+        models_to_train = [name for name in models_to_train if name in model_registry]
         
-        for model_name in models_to_train:
-            if model_name in self.classification_models:
-                print(f"Training {model_name}...")
-                
-                model = self.classification_models[model_name]
-                
-                # Train the model
-                model.fit(X_train, y_train)
-                
-                # Make predictions
-                y_pred = model.predict(X_test)
-                y_pred_proba = None
-                if hasattr(model, 'predict_proba'):
-                    y_pred_proba = model.predict_proba(X_test)
-                
-                # Calculate metrics
-                accuracy = accuracy_score(y_test, y_pred)
-                precision = precision_score(y_test, y_pred, average='weighted', zero_division=0)
-                recall = recall_score(y_test, y_pred, average='weighted', zero_division=0)
-                f1 = f1_score(y_test, y_pred, average='weighted', zero_division=0)
-                
-                # Cross-validation score
-                cv_scores = cross_val_score(model, X_train, y_train, cv=5, scoring='accuracy')
-                
-                results[model_name] = {
-                    'model': model,
-                    'predictions': y_pred,
-                    'probabilities': y_pred_proba,
-                    'accuracy': accuracy,
-                    'precision': precision,
-                    'recall': recall,
-                    'f1_score': f1,
-                    'cv_mean': cv_scores.mean(),
-                    'cv_std': cv_scores.std(),
-                    'classification_report': classification_report(y_test, y_pred),
-                    'confusion_matrix': confusion_matrix(y_test, y_pred)
-                }
-                
-                self.models[model_name] = model
+        results = self._train_models('classification', model_registry, models_to_train,
+                                     X_train, X_test, y_train, y_test, n_jobs, single_pass_cv, run)
         
-        self.results['classification'] = results
+        with self._lock:
+            self._scope(run).results['classification'] = results
         return results
     
-    def train_regression_models(self, X_train, X_test, y_train, y_test, models_to_train=None):
-        """Train multiple regression models"""
+    def train_regression_models(self, X_train, X_test, y_train, y_test, models_to_train=None, n_jobs=1,
+                                single_pass_cv=False, engine='standard', run=None):
+        """Train multiple regression models
+        
+        Set n_jobs to a worker count (or -1 for all cores) to train the models
+        in parallel across a process pool. With single_pass_cv the 5 CV folds
+        are fitted once and their ensemble is used for the holdout metrics.
+        The ensemble runs all 5 fold models on every predict, so prediction-heavy
+        models can end up slower overall; nearest-neighbour models are refitted
+        on the full training set instead.
+        engine='fast' trains 'Gradient Boosting' as histogram-based boosting
+        with early stopping and native missing-value support. Pass a TrainingRun
+        as run to keep the fitted models and results out of the shared registries.
+        """
+        model_registry = self._model_registry('regression', engine)
+        
         if models_to_train is None:
-            models_to_train = list(self.regression_models.keys())
+            models_to_train = list(model_registry.keys())
+        
+        models_to_train = [name for name in models_to_train if name in model_registry]
+        
+        results = self._train_models('regression', model_registry, models_to_train,
+                                     X_train, X_test, y_train, y_test, n_jobs, single_pass_cv, run)
+        
+        with self._lock:
+            self._scope(run).results['regression'] = results
+        return results
+    
+    def _model_registry(self, problem_type, engine='standard'):
+        """Models available for a train call, with fast-engine substitutions applied"""
+        if engine not in ('standard', 'fast'):
+            raise ValueError("engine must be 'standard' or 'fast'")
+        
+        with self._lock:
+            registry = dict(self.classification_models if problem_type == 'classification' else self.regression_models)
+            if engine == 'fast':
+                registry.update(self.fast_engine_models[problem_type])
+        return registry
+    
+    def _train_models(self, problem_type, model_registry, models_to_train, X_train, X_test, y_train, y_test,
+                      n_jobs=1, single_pass_cv=False, run=None):
+        """Train the requested models serially or across a loky process pool
+        
+        Every model is a fresh clone of its registry entry, so concurrent calls
+        never fit the same estimator instance. If the features contain NaNs
+        (prepare_data with impute_missing=False), models without native
+        missing-value support train on copies imputed with the training means
+        and their result is flagged with 'imputed_missing'.
+        """
+        scope = self._scope(run)
+        with self._lock:
+            scalers = dict(scope.scalers)
         
         results = {}
+        n_workers = _resolve_n_jobs(n_jobs, len(models_to_train))
+        trace_memory = any(getattr(callback, 'trace_memory', False) for callback in self.callbacks)
         
-        for model_name in models_to_train:
-            if model_name in self.regression_models:
-                print(f"Training {model_name}...")
-                
-                model = self.regression_models[model_name]
-                
-                # Train the model
-                model.fit(X_train, y_train)
-                
-                # Make predictions
-                y_pred = model.predict(X_test)
-                
-                # Calculate metrics
-                mse = mean_squared_error(y_test, y_pred)
-                mae = mean_absolute_error(y_test, y_pred)
-                r2 = r2_score(y_test, y_pred)
-                rmse = np.sqrt(mse)
-                
-                # Cross-validation score
-                cv_scores = cross_val_score(model, X_train, y_train, cv=5, scoring='r2')
+        # Feature variants keyed by whether they were imputed, each hashed once for the cache lookups
+        variants = {False: [X_train, X_test, None]}
+        if _has_missing(X_train) or _has_missing(X_test):
+            if any(not _allows_nan(model_registry[name]) for name in models_to_train):
+                variants[True] = [*_impute_train_means(X_train, X_test), None]
+        imputed = {name: True in variants and not _allows_nan(model_registry[name]) for name in models_to_train}
+        if self.artifact_store is not None:
+            for variant in variants.values():
+                variant[2] = fingerprint_data(variant[0], y_train)
+        
+        if n_workers == 1:
+            # One shared tracing session for the call, so concurrent runs never stop each other's tracing
+            with memory_tracing(trace_memory):
+                for model_name in models_to_train:
+                    X_train_model, X_test_model, data_fingerprint = variants[imputed[model_name]]
+                    recorder = PhaseRecorder(model_name, problem_type, trace_memory, emit=self._emit)
+                    results[model_name] = _train_single_model(
+                        problem_type, clone(model_registry[model_name]), X_train_model, X_test_model, y_train,
+                        y_test, single_pass_cv, self.artifact_store, scalers, recorder, data_fingerprint
+                    )
+        else:
+            # loky writes large arrays to memory maps once and every worker attaches to them,
+            # instead of pickling X_train/X_test again for each model
+            outputs = Parallel(n_jobs=n_workers, backend='loky')(
+                delayed(_train_single_model)(
+                    problem_type, clone(model_registry[model_name]), *variants[imputed[model_name]][:2], y_train,
+                    y_test, single_pass_cv, self.artifact_store, scalers,
+                    PhaseRecorder(model_name, problem_type, trace_memory), variants[imputed[model_name]][2]
+                )
+                for model_name in models_to_train
+            )
+            
+            # Parallel returns in request order so the results dict keeps its usual ordering
+            for model_name, result in zip(models_to_train, outputs):
+                results[model_name] = result
                 
-                results[model_name] = {
-                    'model': model,
-                    'predictions': y_pred,
-                    'mse': mse,
-                    'mae': mae,
-                    'r2_score': r2,
-                    'rmse': rmse,
-                    'cv_mean': cv_scores.mean(),
-                    'cv_std': cv_scores.std()
-                }
+                # Workers cannot reach the callbacks, so replay their events here
+                for event in result['events']:
+                    self._emit(event)
+        
+        for model_name, result in results.items():
+            if imputed[model_name]:
+                result['imputed_missing'] = True
+        
+        with self._lock:
+            for model_name, result in results.items():
+                scope.models[model_name] = result['model']
                 
-                self.models[model_name] = model
+                # Restore scalers persisted alongside cached models (e.g. after a restart)
+                for scaler_name, scaler in result.pop('scalers', {}).items():
+                    scope.scalers.setdefault(scaler_name, scaler)
+                result.pop('events', None)
+        
+        return results
+    
+    def train_progressive(self, X_train, X_test, y_train, y_test, problem_type='classification',
+                          models_to_train=None, initial_size=1000, growth_factor=4, tolerance=0.005,
+                          patience=1, n_jobs=1, single_pass_cv=False, engine='standard', run=None):
+        """Train on geometrically growing stratified subsamples, yielding provisional results per stage
+        
+        Each stage trains on initial_size * growth_factor**k training rows (the
+        last one on all of them) and yields a dict with its results and the change
+        in each model's main holdout score (accuracy or r2) since the previous
+        stage. Training stops early once no score moves by more than tolerance
+        for patience consecutive stages. The models and results of the last
+        stage are then stored like those of train_classification_models.
+        """
+        if problem_type not in ('classification', 'regression'):
+            raise ValueError("problem_type must be 'classification' or 'regression'")
+        if growth_factor <= 1:
+            raise ValueError("growth_factor must be greater than 1")
+        
+        model_registry = self._model_registry(problem_type, engine)
+        if models_to_train is None:
+            models_to_train = list(model_registry.keys())
+        models_to_train = [name for name in models_to_train if name in model_registry]
+        
+        metric = 'accuracy' if problem_type == 'classification' else 'r2_score'
+        n_samples = _num_samples(X_train)
+        sizes = _progressive_sizes(n_samples, initial_size, growth_factor)
+        
+        scope = self._scope(run)
+        previous_scores = None
+        stable_stages = 0
+        
+        for stage, size in enumerate(sizes):
+            sample = _stratified_subsample(y_train, size, problem_type)
+            X_sample = _safe_indexing(X_train, sample)
+            y_sample = _safe_indexing(y_train, sample)
+            
+            # Each stage trains in its own run so provisional models never reach the shared registries
+            stage_run = self.start_run()
+            with self._lock:
+                stage_run.scalers = dict(scope.scalers)
+            
+            stage_started = time.perf_counter()
+            results = self._train_models(problem_type, model_registry, models_to_train, X_sample, X_test,
+                                         y_sample, y_test, n_jobs, single_pass_cv, stage_run)
+            
+            scores = {model_name: result[metric] for model_name, result in results.items()}
+            deltas = None
+            if previous_scores is not None:
+                deltas = {model_name: abs(scores[model_name] - previous_scores[model_name]) for model_name in scores}
+                stable_stages = stable_stages + 1 if max(deltas.values(), default=0) <= tolerance else 0
+            previous_scores = scores
+            
+            converged = deltas is not None and stable_stages >= patience
+            is_final = converged or size == n_samples
+            
+            if is_final:
+                with self._lock:
+                    scope.models.update(stage_run.models)
+                    scope.results[problem_type] = results
+            
+            yield {
+                'stage': stage,
+                'n_samples': size,
+                'fraction': size / n_samples,
+                'metric': metric,
+                'scores': scores,
+                'deltas': deltas,
+                'results': results,
+                'converged': converged,
+                'is_final': is_final,
+                'stage_time': time.perf_counter() - stage_started
+            }
+            
+            if is_final:
+                return
+    
+    def train_incremental(self, source, target_column=None, problem_type='classification', feature_columns=None,
+                          models_to_train=None, chunksize=100000, test_size=0.2, classes=None, run=None):
+        """Train partial_fit estimators on a CSV/Parquet source streamed in chunks
+        
+        The source is read three times: once to fit the feature scaler (and find
+        the classes), once to train, and once to score the held-out rows. Rows
+        are assigned to the holdout stream with a fixed seed, so every pass sees
+        the same split. Missing feature values are imputed with the running mean.
+        """
+        if problem_type not in self.incremental_models:
+            raise ValueError(f"problem_type must be one of {list(self.incremental_models)}")
+        if problem_type != 'clustering' and target_column is None:
+            raise ValueError("target_column is required for classification and regression")
+        
+        with self._lock:
+            registry = dict(self.incremental_models[problem_type])
+        if models_to_train is None:
+            models_to_train = list(registry.keys())
+        models = {name: clone(registry[name]) for name in models_to_train if name in registry}
+        
+        def stream():
+            # Re-seeded per pass so the holdout assignment is identical every time
+            rng = np.random.default_rng(42)
+            for chunk in iter_table_chunks(source, chunksize):
+                if target_column is not None:
+                    chunk = chunk.dropna(subset=[target_column])
+                is_test = rng.random(len(chunk)) < test_size
+                y = chunk[target_column].to_numpy() if target_column is not None else None
+                yield chunk, is_test, y
+        
+        # Pass 1: running scaler statistics and the set of classes
+        scaler = StandardScaler()
+        found_classes = np.array([])
+        for chunk, is_test, y in stream():
+            if feature_columns is None:
+                feature_columns = [col for col in chunk.select_dtypes(include=[np.number]).columns
+                                   if col != target_column]
+            if (~is_test).any():
+                scaler.partial_fit(chunk[feature_columns].to_numpy(dtype=np.float64)[~is_test])
+            if problem_type == 'classification' and classes is None:
+                found_classes = np.union1d(found_classes, np.unique(y)) if len(found_classes) else np.unique(y)
+        if classes is None:
+            classes = found_classes
+        classes = np.asarray(classes)
+        
+        def transform(chunk, mask):
+            X = scaler.transform(chunk[feature_columns].to_numpy(dtype=np.float64)[mask], copy=False)
+            # NaNs survive scaling; zero is the running mean in scaled space
+            return np.nan_to_num(X, copy=False)
         
-        self.results['regression'] = results
+        # Pass 2: train every model chunk by chunk
+        n_train_rows = 0
+        for chunk, is_test, y in stream():
+            train_mask = ~is_test
+            if not train_mask.any():
+                continue
+            X_chunk = transform(chunk, train_mask)
+            n_train_rows += len(X_chunk)
+            for model_name, model in models.items():
+                if problem_type == 'classification':
+                    model.partial_fit(X_chunk, y[train_mask], classes=classes)
+                elif problem_type == 'regression':
+                    model.partial_fit(X_chunk, y[train_mask])
+                elif len(X_chunk) >= model.n_clusters:
+                    model.partial_fit(X_chunk)
+        
+        # Pass 3: accumulate holdout metrics without keeping predictions around
+        accumulators = {name: _StreamingMetrics(problem_type, classes) for name in models}
+        for chunk, is_test, y in stream():
+            if not is_test.any():
+                continue
+            X_chunk = transform(chunk, is_test)
+            for model_name, model in models.items():
+                accumulators[model_name].update(model, X_chunk, y[is_test] if y is not None else None)
+        
+        results = {}
+        for model_name, model in models.items():
+            results[model_name] = {
+                'model': model,
+                **accumulators[model_name].result(),
+                'n_train_rows': n_train_rows
+            }
+        
+        scope = self._scope(run)
+        with self._lock:
+            scope.models.update(models)
+            scope.scalers['feature_scaler'] = scaler
+            scope.results['incremental'] = results
         return results
     
-    def perform_clustering(self, X, n_clusters_range=None, algorithms=None):
-        """Perform clustering analysis"""
+    def perform_clustering(self, X, n_clusters_range=None, algorithms=None, mini_batch=False, warm_start=False,
+                           silhouette_sample_size=None, n_jobs=1, dbscan_eps=0.5, dbscan_min_samples=5,
+                           cache_neighbor_graph=False, run=None):
+        """Perform clustering analysis
+        
+        For large tables: mini_batch swaps in MiniBatchKMeans, warm_start seeds
+        each k from the previous k's centroids, silhouette_sample_size scores a
+        random sample instead of all pairs, and n_jobs evaluates the k values in
+        parallel (which takes precedence over warm_start).
+        
+        dbscan_eps may be a float, 'auto' (knee of the k-distance curve) or a
+        list of values to sweep. Every eps of a call is evaluated against one
+        radius neighbor graph; a sweep adds a 'DBSCAN_eps_<eps>' entry per value
+        and keeps the best silhouette under 'DBSCAN'. The graph (up to n^2
+        entries) is released after the call unless cache_neighbor_graph is set,
+        which keeps it on the run (or builder) for repeat calls until
+        clear_neighbor_graph_cache.
+        """
         if algorithms is None:
             algorithms = ['KMeans', 'DBSCAN']
         
@@ -208,45 +1332,105 @@ class MLModelBuilder:
         for algorithm in algorithms:
             if algorithm == 'KMeans':
                 # Try different numbers of clusters
-                for n_clusters in n_clusters_range:
-                    model = KMeans(n_clusters=n_clusters, random_state=42)
-                    cluster_labels = model.fit_predict(X_scaled)
+                n_clusters_range = list(n_clusters_range)
+                n_workers = _resolve_n_jobs(n_jobs, len(n_clusters_range))
+                
+                if n_workers > 1:
+                    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_clustering_worker,
+                                             initargs=(X_scaled,)) as executor:
+                        futures = [
+                            executor.submit(_fit_kmeans_worker, n_clusters, mini_batch, silhouette_sample_size)
+                            for n_clusters in n_clusters_range
+                        ]
+                        for n_clusters, future in zip(n_clusters_range, futures):
+                            results[f'KMeans_{n_clusters}'] = future.result()
+                else:
+                    init_centers = None
+                    for n_clusters in n_clusters_range:
+                        result = _fit_kmeans(X_scaled, n_clusters, mini_batch, silhouette_sample_size, init_centers)
+                        results[f'KMeans_{n_clusters}'] = result
+                        
+                        if warm_start:
+                            init_centers = _grow_centers(X_scaled, result['model'])
+                            if len(init_centers) != n_clusters + 1:
+                                init_centers = None
+            
+            elif algorithm == 'DBSCAN':
+                sweep = isinstance(dbscan_eps, (list, tuple, np.ndarray))
+                eps_values = [
+                    estimate_dbscan_eps(X_scaled, dbscan_min_samples) if eps == 'auto' else float(eps)
+                    for eps in (dbscan_eps if sweep else [dbscan_eps])
+                ]
+                graph = self._radius_neighbor_graph(X_scaled, max(eps_values), run, cache_neighbor_graph)
+                
+                dbscan_results = {}
+                for eps in eps_values:
+                    # Entries beyond eps are ignored, so one graph serves the whole sweep
+                    model = DBSCAN(eps=eps, min_samples=dbscan_min_samples, metric='precomputed')
+                    cluster_labels = model.fit_predict(graph)
+                    
+                    n_clusters = len(set(cluster_labels)) - (1 if -1 in cluster_labels else 0)
                     
-                    # Calculate silhouette score
-                    silhouette_avg = silhouette_score(X_scaled, cluster_labels)
+                    if n_clusters > 1:
+                        silhouette_avg = _silhouette(X_scaled, cluster_labels, silhouette_sample_size)
+                    else:
+                        silhouette_avg = -1  # Invalid clustering
                     
-                    results[f'KMeans_{n_clusters}'] = {
+                    dbscan_results[eps] = {
                         'model': model,
                         'labels': cluster_labels,
                         'n_clusters': n_clusters,
                         'silhouette_score': silhouette_avg,
-                        'inertia': model.inertia_
+                        'n_noise_points': int((cluster_labels == -1).sum()),
+                        'eps': eps
                     }
-            
-            elif algorithm == 'DBSCAN':
-                model = DBSCAN(eps=0.5, min_samples=5)
-                cluster_labels = model.fit_predict(X_scaled)
-                
-                n_clusters = len(set(cluster_labels)) - (1 if -1 in cluster_labels else 0)
                 
-                if n_clusters > 1:
-                    silhouette_avg = silhouette_score(X_scaled, cluster_labels)
-                else:
-                    silhouette_avg = -1  # Invalid clustering
-                
-                results['DBSCAN'] = {
-                    'model': model,
-                    'labels': cluster_labels,
-                    'n_clusters': n_clusters,
-                    'silhouette_score': silhouette_avg,
-                    'n_noise_points': list(cluster_labels).count(-1)
-                }
-        
-        self.results['clustering'] = results
+                if sweep:
+                    for eps, result in dbscan_results.items():
+                        results[f'DBSCAN_eps_{eps:.4g}'] = result
+                results['DBSCAN'] = max(dbscan_results.values(), key=lambda result: result['silhouette_score'])
+        
+        with self._lock:
+            self._scope(run).results['clustering'] = results
         return results
     
-    def hyperparameter_tuning(self, model_name, X_train, y_train, param_grid, cv=5):
-        """Perform hyperparameter tuning using GridSearchCV"""
+    def _radius_neighbor_graph(self, X_scaled, radius, run=None, cache=False):
+        """Sparse radius neighbor graph; with cache, kept and reused while the data is unchanged and radius fits"""
+        scope = self._scope(run)
+        if cache:
+            fingerprint = fingerprint_data(X_scaled)
+            with self._lock:
+                cached = scope.neighbor_graph_cache
+            if cached is not None and cached[0] == fingerprint and cached[1] >= radius:
+                return cached[2]
+        
+        algorithm = 'kd_tree' if X_scaled.shape[1] <= 20 else 'ball_tree'
+        neighbors = NearestNeighbors(radius=radius, algorithm=algorithm).fit(X_scaled)
+        graph = neighbors.radius_neighbors_graph(X_scaled, mode='distance', sort_results=True)
+        
+        if cache:
+            with self._lock:
+                scope.neighbor_graph_cache = (fingerprint, radius, graph)
+        return graph
+    
+    def clear_neighbor_graph_cache(self, run=None):
+        """Release the cached DBSCAN neighbor graph, which can hold up to n^2 entries"""
+        with self._lock:
+            self._scope(run).neighbor_graph_cache = None
+    
+    def hyperparameter_tuning(self, model_name, X_train, y_train, param_grid, cv=5, search='grid',
+                              max_fits=None, n_iter=10, factor=3, n_jobs=-1, share_memory=True):
+        """Perform hyperparameter tuning
+        
+        search selects the strategy: 'grid' (exhaustive GridSearchCV), 'random'
+        (n_iter sampled candidates), 'halving' (successive halving over the full
+        grid) or 'halving_random' (successive halving over sampled candidates).
+        max_fits caps the number of model fits for the random and halving modes.
+        With share_memory and more than one worker, the training data is placed
+        in a memory-mapped file once and the workers attach to it instead of
+        each unpickling their own copy; the best model is then refitted on the
+        original X_train so it keeps its feature names.
+        """
         if model_name in self.classification_models:
             base_model = self.classification_models[model_name]
             scoring = 'accuracy'
@@ -256,26 +1440,63 @@ class MLModelBuilder:
         else:
             raise ValueError(f"Model {model_name} not found")
         
-        grid_search = GridSearchCV(
-            base_model, param_grid, cv=cv, scoring=scoring, n_jobs=-1
-        )
+        n_splits = check_cv(cv, y_train, classifier=is_classifier(base_model)).get_n_splits()
+        n_candidates = len(ParameterGrid(param_grid))
+        
+        if search == 'grid':
+            search_cv = GridSearchCV(
+                base_model, param_grid, cv=cv, scoring=scoring, n_jobs=n_jobs
+            )
+        elif search == 'random':
+            if max_fits is not None:
+                n_iter = max(1, max_fits // n_splits)
+            search_cv = RandomizedSearchCV(
+                base_model, param_grid, n_iter=min(n_iter, n_candidates), cv=cv, scoring=scoring,
+                n_jobs=n_jobs, random_state=42
+            )
+        elif search in ('halving', 'halving_random'):
+            halving_candidates = n_candidates if search == 'halving' else min(n_iter, n_candidates)
+            if max_fits is not None:
+                # Successive halving costs about n_candidates * factor / (factor - 1) rounds of CV
+                budget_candidates = max(factor, int(max_fits / n_splits * (factor - 1) / factor))
+                halving_candidates = min(halving_candidates, budget_candidates)
+            
+            if search == 'halving' and halving_candidates == n_candidates:
+                search_cv = HalvingGridSearchCV(
+                    base_model, param_grid, factor=factor, cv=cv, scoring=scoring,
+                    n_jobs=n_jobs, random_state=42
+                )
+            else:
+                search_cv = HalvingRandomSearchCV(
+                    base_model, param_grid, n_candidates=halving_candidates, factor=factor, cv=cv,
+                    scoring=scoring, n_jobs=n_jobs, random_state=42
+                )
+        else:
+            raise ValueError("search must be 'grid', 'random', 'halving' or 'halving_random'")
         
-        grid_search.fit(X_train, y_train)
+        if share_memory and _resolve_n_jobs(n_jobs, n_candidates * n_splits) > 1:
+            search_cv.set_params(refit=False)
+            with shared_arrays(X_train, y_train) as (X_shared, y_shared):
+                search_cv.fit(X_shared, y_shared)
+            best_model = clone(base_model).set_params(**search_cv.best_params_).fit(X_train, y_train)
+        else:
+            search_cv.fit(X_train, y_train)
+            best_model = search_cv.best_estimator_
         
         return {
-            'best_params': grid_search.best_params_,
-            'best_score': grid_search.best_score_,
-            'best_model': grid_search.best_estimator_,
-            'cv_results': grid_search.cv_results_
+            'best_params': search_cv.best_params_,
+            'best_score': search_cv.best_score_,
+            'best_model': best_model,
+            'cv_results': search_cv.cv_results_,
+            'n_fits': len(search_cv.cv_results_['params']) * n_splits
         }
     
-    def feature_importance_analysis(self, model_name, feature_names):
+    def feature_importance_analysis(self, model_name, feature_names, run=None):
         """Analyze feature importance for tree-based models"""
-        if model_name not in self.models:
+        model = self._scope(run).models.get(model_name)
+        if model is None:
             return None
         
-        model = self.models[model_name]
-        
         if hasattr(model, 'feature_importances_'):
             importance_df = pd.DataFrame({
                 'feature': feature_names,
@@ -286,13 +1507,12 @@ class MLModelBuilder:
         else:
             return None
     
-    def model_comparison(self, problem_type='classification'):
+    def model_comparison(self, problem_type='classification', run=None):
         """Compare performance of different models"""
-        if problem_type not in self.results:
+        results = self._scope(run).results.get(problem_type)
+        if results is None:
             return None
         
-        results = self.results[problem_type]
-        
         if problem_type == 'classification':
             comparison_df = pd.DataFrame({
                 'Model': list(results.keys()),
@@ -317,17 +1537,51 @@ class MLModelBuilder:
         
         return comparison_df
     
-    def predict_new_data(self, model_name, X_new):
-        """Make predictions on new data"""
-        if model_name not in self.models:
-            raise ValueError(f"Model {model_name} not found. Train the model first.")
+    def compile_model(self, model_name, run=None):
+        """Export a trained tree model to a CompiledTreeEnsemble for low-latency scoring
+        
+        Fold ensembles from single_pass_cv are compiled fold by fold.
+        """
+        model, _ = self._get_model(model_name, run)
+        if isinstance(model, FoldEnsemble):
+            compiled = FoldEnsemble([CompiledTreeEnsemble(fold_model) for fold_model in model.fold_models],
+                                    model.classes_)
+        else:
+            compiled = CompiledTreeEnsemble(model)
+        with self._lock:
+            self._scope(run).compiled_models[model_name] = compiled
+        return compiled
+    
+    def save_model(self, model_name, path, feature_columns=None, run=None):
+        """Save a trained model with its feature scaler for batch scoring (see utils/batch_score.py)"""
+        model, scaler = self._get_model(model_name, run)
+        if feature_columns is None:
+            feature_columns = self._scope(run).feature_metadata.get('columns')
+        return save_model_bundle(path, model, scaler, feature_columns, {'model_name': model_name})
+    
+    def load_model(self, path, model_name=None, run=None):
+        """Register a model saved with save_model, replacing the current feature scaler if it has one"""
+        bundle = load_model_bundle(path)
+        model_name = model_name or bundle['metadata'].get('model_name', os.path.basename(path))
         
-        model = self.models[model_name]
+        with self._lock:
+            scope = self._scope(run)
+            scope.models[model_name] = bundle['model']
+            if bundle['scaler'] is not None:
+                scope.scalers['feature_scaler'] = bundle['scaler']
+        return model_name
+    
+    def predict_new_data(self, model_name, X_new, run=None):
+        """Make predictions on new data"""
+        model, scaler = self._get_model(model_name, run)
         
         # Scale the new data if scaler exists
-        if 'feature_scaler' in self.scalers:
-            X_new_scaled = self.scalers['feature_scaler'].transform(X_new)
-            X_new = pd.DataFrame(X_new_scaled, columns=X_new.columns, index=X_new.index)
+        if scaler is not None:
+            X_new_scaled = scaler.transform(X_new)
+            if isinstance(X_new, pd.DataFrame):
+                X_new = pd.DataFrame(X_new_scaled, columns=X_new.columns, index=X_new.index)
+            else:
+                X_new = X_new_scaled
         
         predictions = model.predict(X_new)
         
@@ -340,6 +1594,202 @@ class MLModelBuilder:
             'predictions': predictions,
             'probabilities': probabilities
         }
+    
+    def iter_predictions(self, model_name, X_new, batch_size=10000, output='both', run=None):
+        """Yield (start_row, predictions, probabilities) for fixed-size chunks of X_new
+        
+        output chooses what is computed per chunk: 'both', 'labels' or 'proba'.
+        """
+        model, scaler = self._get_model(model_name, run)
+        
+        for start in range(0, _num_samples(X_new), batch_size):
+            X_chunk = _slice_rows(X_new, start, start + batch_size)
+            predictions, probabilities = score_chunk(model, X_chunk, scaler, output)
+            yield start, predictions, probabilities
+    
+    def predict_new_data_batched(self, model_name, X_new, batch_size=10000, output='both', n_jobs=1, run=None):
+        """Make predictions on new data chunk by chunk into preallocated buffers
+        
+        Returns the same dict as predict_new_data. Set n_jobs to score chunks
+        across worker processes.
+        """
+        model, scaler = self._get_model(model_name, run)
+        n_rows = _num_samples(X_new)
+        
+        predictions, probabilities = _allocate_prediction_buffers(model, n_rows, output)
+        starts = range(0, n_rows, batch_size)
+        n_workers = _resolve_n_jobs(n_jobs, len(starts))
+        
+        if n_workers == 1:
+            chunk_results = self.iter_predictions(model_name, X_new, batch_size, output, run)
+        else:
+            chunk_results = _score_chunks_in_pool(
+                model, scaler, X_new, starts, batch_size, output, n_workers
+            )
+        
+        for start, chunk_predictions, chunk_probabilities in chunk_results:
+            stop = start + batch_size
+            if predictions is not None:
+                predictions[start:stop] = chunk_predictions
+            if probabilities is not None:
+                probabilities[start:stop] = chunk_probabilities
+        
+        return {
+            'predictions': predictions,
+            'probabilities': probabilities
+        }
+
+class LearningCurveEngine:
+    """
+    Learning curves computed point by point with an optional on-disk score cache
+    
+    Each (train size, fold) score pair is stored in a JSON file keyed by the
+    estimator, data and CV fingerprints, so adding a train size only fits the
+    new points. With warm_start, estimators supporting partial_fit grow their
+    training set incrementally along each fold instead of refitting per size.
+    With share_memory, parallel runs hand X and y to the workers as one
+    memory-mapped copy.
+    """
+    
+    def __init__(self, cache_dir=None, n_jobs=-1, share_memory=True):
+        self.cache_dir = cache_dir
+        self.n_jobs = n_jobs
+        self.share_memory = share_memory
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+    
+    def _cache_path(self, model, X, y, splitter, scoring, incremental):
+        # Incremental partial_fit scores differ from full refits, so the two never share a file
+        key = '|'.join([fingerprint_estimator(model), fingerprint_data(X, y), repr(splitter), repr(scoring),
+                        'incremental' if incremental else 'refit'])
+        return os.path.join(self.cache_dir, f"learning_curve_{hashlib.sha256(key.encode()).hexdigest()}.json")
+    
+    def _load(self, path):
+        if path is None or not os.path.exists(path):
+            return {}
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save(self, path, points):
+        if path is None:
+            return
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(points, f)
+        os.replace(tmp_path, path)
+    
+    def iter_points(self, model, X, y, cv=5, train_sizes=None, warm_start=False, scoring=None):
+        """Yield {'train_size', 'fold', 'train_score', 'val_score', 'cached'} per point"""
+        if train_sizes is None:
+            train_sizes = np.linspace(0.1, 1.0, 10)
+        
+        y_values = np.asarray(y)
+        splitter = check_cv(cv, y_values, classifier=is_classifier(model))
+        folds = list(splitter.split(X, y_values))
+        sizes = _absolute_train_sizes(train_sizes, min(len(train) for train, _ in folds))
+        scorer = check_scoring(model, scoring=scoring)
+        
+        incremental = warm_start and hasattr(model, 'partial_fit')
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = self._cache_path(model, X, y, splitter, scoring, incremental)
+        points = self._load(cache_path)
+        
+        missing = {}
+        for fold, _ in enumerate(folds):
+            for size in sizes:
+                key = f"{size}:{fold}"
+                if key in points:
+                    train_score, val_score = points[key]
+                    yield {'train_size': int(size), 'fold': fold, 'train_score': train_score,
+                           'val_score': val_score, 'cached': True}
+                else:
+                    missing.setdefault(fold, []).append(int(size))
+        
+        if not missing:
+            return
+        
+        n_tasks = len(missing) if incremental else sum(len(fold_sizes) for fold_sizes in missing.values())
+        share = self.share_memory and _resolve_n_jobs(self.n_jobs, n_tasks) > 1
+        
+        with shared_arrays(X, y_values) if share else nullcontext((X, y_values)) as (X_data, y_data):
+            if incremental:
+                # One task per fold: partial_fit through the sizes in increasing order
+                classes = np.unique(y_values) if is_classifier(model) else None
+                tasks = [delayed(_incremental_curve_points)(clone(model), X_data, y_data, folds[fold][0],
+                                                            folds[fold][1], fold_sizes, scorer, classes)
+                         for fold, fold_sizes in missing.items()]
+                keys = [[(size, fold) for size in fold_sizes] for fold, fold_sizes in missing.items()]
+            else:
+                tasks = [delayed(_learning_curve_point)(clone(model), X_data, y_data, folds[fold][0][:size],
+                                                        folds[fold][1], scorer)
+                         for fold, fold_sizes in missing.items() for size in fold_sizes]
+                keys = [[(size, fold)] for fold, fold_sizes in missing.items() for size in fold_sizes]
+            
+            parallel = Parallel(n_jobs=self.n_jobs, return_as='generator')
+            for task_keys, task_scores in zip(keys, parallel(tasks)):
+                if not incremental:
+                    task_scores = [task_scores]
+                for (size, fold), (train_score, val_score) in zip(task_keys, task_scores):
+                    points[f"{size}:{fold}"] = [train_score, val_score]
+                    yield {'train_size': size, 'fold': fold, 'train_score': train_score,
+                           'val_score': val_score, 'cached': False}
+                self._save(cache_path, points)
+    
+    def learning_curve(self, model, X, y, cv=5, train_sizes=None, warm_start=False, callback=None, scoring=None):
+        """Aggregate the points into the summary returned by plot_learning_curve"""
+        collected = []
+        for point in self.iter_points(model, X, y, cv=cv, train_sizes=train_sizes, warm_start=warm_start,
+                                      scoring=scoring):
+            collected.append(point)
+            if callback is not None:
+                callback(point)
+        
+        points = pd.DataFrame(collected)
+        grouped = points.groupby('train_size')
+        
+        return {
+            'train_sizes': np.array(sorted(points['train_size'].unique())),
+            'train_scores_mean': grouped['train_score'].mean().values,
+            'train_scores_std': grouped['train_score'].std(ddof=0).values,
+            'val_scores_mean': grouped['val_score'].mean().values,
+            'val_scores_std': grouped['val_score'].std(ddof=0).values,
+            'n_cached_points': int(points['cached'].sum()),
+            'n_computed_points': int((~points['cached']).sum())
+        }
+
+def _absolute_train_sizes(train_sizes, n_max):
+    """Convert fractional or absolute train sizes to unique row counts, as learning_curve does"""
+    train_sizes = np.asarray(train_sizes)
+    if np.issubdtype(train_sizes.dtype, np.floating) and train_sizes.max() <= 1.0:
+        train_sizes = (train_sizes * n_max).astype(int)
+    return np.unique(np.clip(train_sizes.astype(int), 1, n_max))
+
+def _learning_curve_point(model, X, y, train_idx, val_idx, scorer):
+    """Fit on one training subset and score it on itself and the validation fold"""
+    X_train = _safe_indexing(X, train_idx)
+    model.fit(X_train, y[train_idx])
+    return scorer(model, X_train, y[train_idx]), scorer(model, _safe_indexing(X, val_idx), y[val_idx])
+
+def _incremental_curve_points(model, X, y, train_idx, val_idx, sizes, scorer, classes=None):
+    """partial_fit one fold through increasing train sizes, scoring after each step"""
+    X_val = _safe_indexing(X, val_idx)
+    scores = []
+    previous = 0
+    for size in sizes:
+        new_idx = train_idx[previous:size]
+        if classes is not None:
+            model.partial_fit(_safe_indexing(X, new_idx), y[new_idx], classes=classes)
+        else:
+            model.partial_fit(_safe_indexing(X, new_idx), y[new_idx])
+        previous = size
+        
+        X_seen = _safe_indexing(X, train_idx[:size])
+        scores.append((scorer(model, X_seen, y[train_idx[:size]]), scorer(model, X_val, y[val_idx])))
+    return scores
 
 class ModelEvaluator:
     """
@@ -347,23 +1797,26 @@ class ModelEvaluator:
     """
     
     @staticmethod
-    def plot_learning_curve(model, X, y, cv=5):
-        """Generate learning curve data"""
-        from sklearn.model_selection import learning_curve
-        
-        train_sizes, train_scores, val_scores = learning_curve(
-            model, X, y, cv=cv, n_jobs=-1, 
-            train_sizes=np.linspace(0.1, 1.0, 10),
-            random_state=42
-        )
+    def plot_learning_curve(model, X, y, cv=5, train_sizes=None, cache_dir=None, warm_start=False,
+                            callback=None, scoring=None, n_jobs=-1, share_memory=True):
+        """Generate learning curve data
         
-        return {
-            'train_sizes': train_sizes,
-            'train_scores_mean': np.mean(train_scores, axis=1),
-            'train_scores_std': np.std(train_scores, axis=1),
-            'val_scores_mean': np.mean(val_scores, axis=1),
-            'val_scores_std': np.std(val_scores, axis=1)
-        }
+        Points are computed by a LearningCurveEngine: with cache_dir, scores
+        for each (train size, fold) are kept on disk and only missing points are
+        fitted; callback(point) receives each point as it completes. With
+        share_memory, parallel workers share one memory-mapped copy of X and y.
+        """
+        engine = LearningCurveEngine(cache_dir=cache_dir, n_jobs=n_jobs, share_memory=share_memory)
+        return engine.learning_curve(model, X, y, cv=cv, train_sizes=train_sizes, warm_start=warm_start,
+                                     callback=callback, scoring=scoring)
+    
+    @staticmethod
+    def iter_learning_curve(model, X, y, cv=5, train_sizes=None, cache_dir=None, warm_start=False,
+                            scoring=None, n_jobs=-1, share_memory=True):
+        """Yield learning curve points as they complete (cached points first)"""
+        engine = LearningCurveEngine(cache_dir=cache_dir, n_jobs=n_jobs, share_memory=share_memory)
+        return engine.iter_points(model, X, y, cv=cv, train_sizes=train_sizes, warm_start=warm_start,
+                                  scoring=scoring)
     
     @staticmethod
     def calculate_prediction_intervals(y_true, y_pred):
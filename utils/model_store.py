@@ -0,0 +1,179 @@
+import os
+import hashlib
+import joblib
+import numpy as np
+import pandas as pd
+
+def fingerprint_data(*arrays):
+    """Return a content hash for a sequence of arrays, Series or DataFrames"""
+    digest = hashlib.sha256()
+    
+    for data in arrays:
+        if isinstance(data, pd.DataFrame):
+            digest.update(repr(list(data.columns)).encode())
+            digest.update(repr(list(data.dtypes.astype(str))).encode())
+            digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        elif isinstance(data, pd.Series):
+            digest.update(repr((data.name, str(data.dtype))).encode())
+            digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        else:
+            array = np.ascontiguousarray(data)
+            digest.update(repr((array.shape, str(array.dtype))).encode())
+            if array.dtype == object:
+                digest.update(pd.util.hash_array(array.ravel()).tobytes())
+            else:
+                digest.update(memoryview(array.reshape(-1).view(np.uint8)))
+    
+    return digest.hexdigest()
+
+def fingerprint_estimator(model):
+    """Return a hash of an estimator's class and hyperparameters"""
+    params = model.get_params(deep=True)
+    description = f"{type(model).__module__}.{type(model).__qualname__}:" + repr(sorted(
+        (name, repr(value)) for name, value in params.items()
+    ))
+    return hashlib.sha256(description.encode()).hexdigest()
+
+def save_model_bundle(path, model, scaler=None, feature_columns=None, metadata=None):
+    """Persist a fitted model with its feature scaler and column order for offline scoring"""
+    if feature_columns is None:
+        feature_columns = getattr(model, 'feature_names_in_', getattr(scaler, 'feature_names_in_', None))
+    
+    bundle = {
+        'model': model,
+        'scaler': scaler,
+        'feature_columns': list(feature_columns) if feature_columns is not None else None,
+        'metadata': metadata or {}
+    }
+    
+    # Write to a temporary file first so readers never see a partial bundle
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    joblib.dump(bundle, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+def load_model_bundle(path, mmap_mode=None):
+    """Load a bundle written by save_model_bundle"""
+    bundle = joblib.load(path, mmap_mode=mmap_mode)
+    if not isinstance(bundle, dict) or 'model' not in bundle:
+        raise ValueError(f"{path} is not a saved model bundle")
+    return bundle
+
+class ModelArtifactStore:
+    """
+    Content-addressed on-disk cache of fitted models with LRU size capping
+    
+    Each artifact is a joblib file named after its key. Access times are kept
+    in the file modification time, so several processes can share one cache
+    directory without a separate index.
+    """
+    
+    def __init__(self, cache_dir='.model_cache', max_size_mb=1024, mmap_mode='r'):
+        self.cache_dir = cache_dir
+        self.max_size_mb = max_size_mb
+        self.mmap_mode = mmap_mode
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def make_key(self, model, X, y, data_fingerprint=None, **options):
+        """Build the cache key for fitting model on (X, y) with extra options
+        
+        Pass data_fingerprint (fingerprint_data(X, y)) to reuse one hash of
+        the data across several models.
+        """
+        if data_fingerprint is None:
+            data_fingerprint = fingerprint_data(X, y)
+        parts = [fingerprint_estimator(model), data_fingerprint, repr(sorted(options.items()))]
+        return hashlib.sha256('|'.join(parts).encode()).hexdigest()
+    
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.joblib")
+    
+    def get(self, key):
+        """Load an artifact, memory-mapping its arrays, or return None on a miss"""
+        path = self._path(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+        
+        try:
+            artifact = joblib.load(path, mmap_mode=self.mmap_mode)
+        except Exception:
+            # Treat unreadable or half-written files as a miss
+            self.misses += 1
+            return None
+        
+        # Touch the file so it counts as recently used
+        os.utime(path, None)
+        self.hits += 1
+        return artifact
+    
+    def put(self, key, artifact):
+        """Persist an artifact and evict least recently used entries over the cap"""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        
+        # Uncompressed so large arrays can be memory-mapped on load
+        joblib.dump(artifact, tmp_path)
+        os.replace(tmp_path, path)
+        
+        self._evict(keep=path)
+        return path
+    
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
+    
+    def entries(self):
+        """Return cached artifacts as a DataFrame ordered from most to least recently used"""
+        rows = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.joblib'):
+                path = os.path.join(self.cache_dir, name)
+                stat = os.stat(path)
+                rows.append({
+                    'key': name[:-len('.joblib')],
+                    'size_mb': stat.st_size / 1024**2,
+                    'last_used': pd.Timestamp(stat.st_mtime, unit='s')
+                })
+        
+        entries = pd.DataFrame(rows, columns=['key', 'size_mb', 'last_used'])
+        return entries.sort_values('last_used', ascending=False).reset_index(drop=True)
+    
+    def size_mb(self):
+        """Total size of the cached artifacts"""
+        return self.entries()['size_mb'].sum()
+    
+    def clear(self):
+        """Remove every cached artifact"""
+        for key in self.entries()['key']:
+            os.remove(self._path(key))
+    
+    def _evict(self, keep=None):
+        """Delete least recently used artifacts until the cache fits max_size_mb"""
+        if self.max_size_mb is None:
+            return
+        
+        entries = self.entries()
+        total = entries['size_mb'].sum()
+        
+        for key, size in zip(entries['key'][::-1], entries['size_mb'][::-1]):
+            if total <= self.max_size_mb:
+                break
+            path = self._path(key)
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+    
+    def stats(self):
+        """Hit/miss counters for this store instance"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.entries()),
+            'size_mb': self.size_mb()
+        }
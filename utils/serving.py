@@ -0,0 +1,430 @@
+"""
+Lightweight HTTP model serving with dynamic micro-batching
+
+Serves models trained by MLModelBuilder (or saved with save_model) over plain
+asyncio, without a web framework. Concurrent requests for the same model are
+coalesced into one batch until the batch is full or the oldest request has
+waited max_latency_ms.
+
+    python -m utils.serving model.joblib --port 8000
+    
+    POST /predict/<model>   {"rows": [{"feature_0": 1.2, ...}, ...]} or {"instances": [[1.2, ...], ...]}
+                            or an Arrow IPC stream (Content-Type: application/vnd.apache.arrow.stream)
+    GET  /models            served models and their feature columns
+    GET  /metrics           request, batch and latency counters
+    GET  /health
+"""
+import io
+import sys
+import json
+import time
+import asyncio
+import argparse
+import threading
+from collections import deque
+from urllib.parse import unquote
+
+import numpy as np
+import pandas as pd
+
+from utils.model_store import load_model_bundle
+from utils.ml_models import score_chunk
+from utils.batch_score import _prepare_chunk
+
+ARROW_CONTENT_TYPE = 'application/vnd.apache.arrow.stream'
+
+class ServingMetrics:
+    """
+    Request, row, batch and latency counters for one model
+    
+    Latency percentiles are computed over the most recent window requests.
+    """
+    
+    def __init__(self, window=10000):
+        self.started = time.time()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.errors = 0
+        self.batch_rows = 0
+        self.max_batch_requests = 0
+        self.latencies = deque(maxlen=window)
+    
+    def record_batch(self, n_requests, n_rows):
+        self.batches += 1
+        self.batch_rows += n_rows
+        self.max_batch_requests = max(self.max_batch_requests, n_requests)
+    
+    def record_request(self, n_rows, latency):
+        self.requests += 1
+        self.rows += n_rows
+        self.latencies.append(latency)
+    
+    def snapshot(self):
+        """Counters plus latency percentiles in milliseconds and overall throughput"""
+        uptime = time.time() - self.started
+        latencies = np.array(self.latencies) * 1000
+        percentiles = np.percentile(latencies, [50, 90, 99]) if len(latencies) > 0 else [None] * 3
+        return {
+            'requests': self.requests,
+            'rows': self.rows,
+            'errors': self.errors,
+            'batches': self.batches,
+            'mean_batch_rows': self.batch_rows / self.batches if self.batches else 0.0,
+            'max_batch_requests': self.max_batch_requests,
+            'latency_ms_p50': percentiles[0],
+            'latency_ms_p90': percentiles[1],
+            'latency_ms_p99': percentiles[2],
+            'requests_per_second': self.requests / uptime if uptime > 0 else 0.0,
+            'rows_per_second': self.rows / uptime if uptime > 0 else 0.0,
+            'uptime_seconds': uptime
+        }
+
+class MicroBatcher:
+    """
+    Coalesces concurrent scoring requests for one model into batches
+    
+    A batch is dispatched as soon as it holds max_batch_rows rows or its
+    oldest request has waited max_latency_ms. Scoring runs in a worker thread
+    so the event loop keeps accepting requests while a batch is scored. If a
+    batch fails, its requests are retried one by one so only the bad request
+    gets the error.
+    """
+    
+    def __init__(self, model, scaler=None, max_batch_rows=1024, max_latency_ms=5, metrics=None):
+        self.model = model
+        self.scaler = scaler
+        self.max_batch_rows = max_batch_rows
+        self.max_latency = max_latency_ms / 1000
+        self.metrics = metrics or ServingMetrics()
+        self._queue = None
+        self._task = None
+    
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def predict(self, X):
+        """Score a 2-D float array as part of the next batch, returning (predictions, probabilities)"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((X, future))
+        return await future
+    
+    async def _next_batch(self):
+        """Wait for one request, then gather more until the batch is full or the deadline passes"""
+        batch = [await self._queue.get()]
+        n_rows = len(batch[0][0])
+        deadline = time.perf_counter() + self.max_latency
+        
+        while n_rows < self.max_batch_rows:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+            n_rows += len(item[0])
+        
+        return batch, n_rows
+    
+    async def _run(self):
+        while True:
+            batch, n_rows = await self._next_batch()
+            try:
+                await self._score_batch(batch)
+                self.metrics.record_batch(len(batch), n_rows)
+            except Exception as error:
+                if len(batch) == 1:
+                    self._fail(batch, error)
+                    continue
+                
+                # Score the requests one by one so a malformed one only fails itself
+                for item in batch:
+                    try:
+                        await self._score_batch([item])
+                        self.metrics.record_batch(1, len(item[0]))
+                    except Exception as item_error:
+                        self._fail([item], item_error)
+    
+    async def _score_batch(self, batch):
+        """Score the batch in the default executor and hand each request its own slice of the results"""
+        X = np.concatenate([X for X, _ in batch]) if len(batch) > 1 else batch[0][0]
+        predictions, probabilities = await asyncio.get_running_loop().run_in_executor(
+            None, score_chunk, self.model, X, self.scaler, 'both'
+        )
+        
+        start = 0
+        for X_request, future in batch:
+            stop = start + len(X_request)
+            if not future.done():
+                future.set_result((
+                    predictions[start:stop],
+                    probabilities[start:stop] if probabilities is not None else None
+                ))
+            start = stop
+    
+    @staticmethod
+    def _fail(batch, error):
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+class ModelServer:
+    """
+    Asyncio HTTP server for a set of fitted models
+    
+    models maps a name to a bundle dict as written by save_model_bundle
+    (model, scaler, feature_columns). Use from_builder or from_paths to
+    build one, then start() inside an event loop or serve_in_thread() for
+    local testing.
+    """
+    
+    def __init__(self, models, host='127.0.0.1', port=8000, max_batch_rows=1024, max_latency_ms=5):
+        self.models = models
+        self.host = host
+        self.port = port
+        self.batchers = {
+            name: MicroBatcher(bundle['model'], bundle.get('scaler'), max_batch_rows, max_latency_ms)
+            for name, bundle in models.items()
+        }
+        self._server = None
+        self._connections = set()
+    
+    @classmethod
+    def from_builder(cls, builder, model_names=None, run=None, **kwargs):
+        """Serve models already trained by an MLModelBuilder (or one of its runs)"""
+        scope = builder._scope(run)
+        if model_names is None:
+            model_names = list(scope.models.keys())
+        
+        models = {}
+        for model_name in model_names:
+            model, scaler = builder._get_model(model_name, run)
+            feature_columns = scope.feature_metadata.get('columns')
+            if feature_columns is None:
+                feature_columns = getattr(model, 'feature_names_in_', getattr(scaler, 'feature_names_in_', None))
+            models[model_name] = {
+                'model': model,
+                'scaler': scaler,
+                'feature_columns': list(feature_columns) if feature_columns is not None else None
+            }
+        return cls(models, **kwargs)
+    
+    @classmethod
+    def from_paths(cls, paths, **kwargs):
+        """Serve bundles saved with MLModelBuilder.save_model, loaded once at startup"""
+        models = {}
+        for path in paths:
+            bundle = load_model_bundle(path)
+            models[bundle['metadata'].get('model_name', path)] = bundle
+        return cls(models, **kwargs)
+    
+    async def start(self):
+        """Start listening; returns once the socket is bound"""
+        for batcher in self.batchers.values():
+            batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        
+        # Pick up the real port when port=0 asked for any free one
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+    
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        
+        # Idle keep-alive connections would otherwise outlive the server
+        for writer in list(self._connections):
+            writer.close()
+        await asyncio.sleep(0)
+        
+        for batcher in self.batchers.values():
+            await batcher.stop()
+    
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+    
+    def serve_in_thread(self):
+        """Run the server on a background event loop; returns a callable that shuts it down"""
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            ready.set()
+            loop.run_forever()
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        ready.wait()
+        
+        def shutdown():
+            asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+        
+        return shutdown
+    
+    def metrics(self):
+        return {name: batcher.metrics.snapshot() for name, batcher in self.batchers.items()}
+    
+    def _parse_rows(self, model_name, body, content_type):
+        """Turn a request body into the float matrix the model was trained on"""
+        feature_columns = self.models[model_name].get('feature_columns')
+        scaler = self.models[model_name].get('scaler')
+        fill_values = None
+        if feature_columns is not None and scaler is not None and getattr(scaler, 'mean_', None) is not None:
+            fill_values = dict(zip(feature_columns, scaler.mean_))
+        
+        if content_type.startswith(ARROW_CONTENT_TYPE):
+            try:
+                import pyarrow as pa
+            except ImportError:
+                raise ValueError("Arrow requests require pyarrow on the server")
+            frame = pa.ipc.open_stream(io.BytesIO(body)).read_all().to_pandas()
+        else:
+            payload = json.loads(body)
+            if 'rows' in payload:
+                frame = pd.DataFrame(payload['rows'])
+            elif 'instances' in payload:
+                X = np.asarray(payload['instances'], dtype=np.float64)
+                if X.ndim != 2:
+                    raise ValueError("'instances' must be a list of rows")
+                return X
+            else:
+                raise ValueError("Expected 'rows' or 'instances' in the request body")
+        
+        if feature_columns is None:
+            return frame.to_numpy(dtype=np.float64)
+        return _prepare_chunk(frame, feature_columns, fill_values)
+    
+    def _check_width(self, model_name, X):
+        """Reject malformed rows before they can spoil a shared batch"""
+        bundle = self.models[model_name]
+        n_features = getattr(bundle['model'], 'n_features_in_', None)
+        if n_features is None and bundle.get('feature_columns') is not None:
+            n_features = len(bundle['feature_columns'])
+        if n_features is None:
+            n_features = getattr(bundle.get('scaler'), 'n_features_in_', None)
+        if n_features is not None and X.shape[1] != n_features:
+            raise ValueError(f"Expected {n_features} features per row, got {X.shape[1]}")
+    
+    async def _route(self, method, path, headers, body):
+        """Return (status, payload) for one request"""
+        if method == 'GET' and path == '/health':
+            return 200, {'status': 'ok'}
+        if method == 'GET' and path == '/metrics':
+            return 200, self.metrics()
+        if method == 'GET' and path == '/models':
+            return 200, {name: {'feature_columns': bundle.get('feature_columns')}
+                         for name, bundle in self.models.items()}
+        
+        if method == 'POST' and path.startswith('/predict/'):
+            model_name = path[len('/predict/'):]
+            if model_name not in self.batchers:
+                return 404, {'error': f"Model {model_name} not found"}
+            
+            batcher = self.batchers[model_name]
+            started = time.perf_counter()
+            try:
+                X = self._parse_rows(model_name, body, headers.get('content-type', 'application/json'))
+                self._check_width(model_name, X)
+                predictions, probabilities = await batcher.predict(X)
+            except Exception as error:
+                batcher.metrics.errors += 1
+                return 400, {'error': str(error)}
+            batcher.metrics.record_request(len(X), time.perf_counter() - started)
+            
+            return 200, {
+                'predictions': predictions.tolist(),
+                'probabilities': probabilities.tolist() if probabilities is not None else None
+            }
+        
+        return 404, {'error': f"No route for {method} {path}"}
+    
+    async def _handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection until the client closes it"""
+        self._connections.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                status, payload = await self._route(method, unquote(path.split('?', 1)[0]), headers, body)
+                
+                data = json.dumps(payload, default=_json_default).encode()
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found'}
+
+def _json_default(value):
+    """Serialise NumPy scalars in responses"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('models', nargs='+', help="model bundles written by MLModelBuilder.save_model")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--max-batch-rows', type=int, default=1024, help="rows that trigger an immediate batch")
+    parser.add_argument('--max-latency-ms', type=float, default=5,
+                        help="longest a request waits for others to join its batch")
+    args = parser.parse_args(argv)
+    
+    server = ModelServer.from_paths(args.models, host=args.host, port=args.port,
+                                    max_batch_rows=args.max_batch_rows, max_latency_ms=args.max_latency_ms)
+    print(f"Serving {', '.join(server.models)} on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+
+SHARED_MEMORY_DIR = '/dev/shm'
+
+def _shared_temp_dir(temp_folder=None, nbytes=0):
+    """Folder for the memory-mapped files, chosen in the same order as joblib
+    
+    JOBLIB_TEMP_FOLDER wins if set. Otherwise RAM-backed /dev/shm is used
+    only if it has room for nbytes: the files are sparse, so running out of
+    tmpfs space shows up as SIGBUS on write rather than an exception (Docker
+    gives /dev/shm 64 MB by default). Else the system temp directory.
+    """
+    if temp_folder is None:
+        temp_folder = os.environ.get('JOBLIB_TEMP_FOLDER')
+    if temp_folder is None and _has_free_space(SHARED_MEMORY_DIR, nbytes):
+        temp_folder = SHARED_MEMORY_DIR
+    if temp_folder is None:
+        temp_folder = tempfile.gettempdir()
+    return tempfile.mkdtemp(prefix='ml_shared_', dir=temp_folder)
+
+def _has_free_space(folder, nbytes):
+    """Whether folder is writable and has more than nbytes available"""
+    if not os.path.isdir(folder) or not os.access(folder, os.W_OK) or not hasattr(os, 'statvfs'):
+        return False
+    try:
+        stats = os.statvfs(folder)
+    except OSError:
+        return False
+    return stats.f_bsize * stats.f_bavail > nbytes
+
+def _as_array(data):
+    """NumPy array of data as it will be memory-mapped"""
+    if isinstance(data, pd.DataFrame):
+        numeric = all(pd.api.types.is_numeric_dtype(dtype) for dtype in data.dtypes)
+        # Nullable extension columns (Int64, Float64) would otherwise become an object array
+        data = data.to_numpy(dtype=np.float64, na_value=np.nan) if numeric and not data.empty else data.to_numpy()
+    elif isinstance(data, pd.Series):
+        numeric = pd.api.types.is_numeric_dtype(data.dtype) and isinstance(data.dtype, pd.api.extensions.ExtensionDtype)
+        data = data.to_numpy(dtype=np.float64, na_value=np.nan) if numeric else data.to_numpy()
+    return np.asarray(data)
+
+def to_memmap(data, folder, name):
+    """Write data once to a .npy file in folder and return a read-only np.memmap of it
+    
+    Object columns (e.g. string labels) cannot be memory-mapped and are
+    returned as a regular array.
+    """
+    array = _as_array(data)
+    if array.dtype == object:
+        return array
+    
+    path = os.path.join(folder, f"{name}.npy")
+    shared = np.lib.format.open_memmap(path, mode='w+', dtype=array.dtype, shape=array.shape)
+    shared[...] = array
+    shared.flush()
+    del shared
+    return np.load(path, mmap_mode='r')
+
+@contextmanager
+def shared_arrays(*arrays, temp_folder=None):
+    """Yield memory-mapped copies of arrays that joblib/loky workers attach to without copying
+    
+    joblib pickles np.memmap arguments as a reference to their backing file,
+    so every worker maps the same pages instead of receiving its own copy of
+    each DataFrame. The files are removed when the block exits.
+    """
+    arrays = [_as_array(data) for data in arrays]
+    nbytes = sum(array.nbytes for array in arrays if array.dtype != object)
+    
+    folder = _shared_temp_dir(temp_folder, nbytes)
+    try:
+        yield tuple(to_memmap(array, folder, f"array_{i}") for i, array in enumerate(arrays))
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
@@ -0,0 +1,484 @@
+import numpy as np
+import pandas as pd
+
+from utils.chunked_io import iter_table_chunks
+from utils.data_analysis import SUMMARY_INDEX, _lerp
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch in the style of KLL
+    
+    Values enter level 0 with weight 1. When a level holds more than k items
+    it is sorted and every other item (from a random offset) is promoted to
+    the next level with twice the weight. Rank error is O(log(n/k) / k); until
+    n exceeds k the sketch is exact.
+    """
+    
+    def __init__(self, k=512, seed=42):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.n = 0
+        self._rng = np.random.default_rng(seed)
+    
+    def update(self, values):
+        """Add a 1D array of non-missing values"""
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+    
+    def merge(self, other):
+        """Fold another sketch into this one"""
+        self.n += other.n
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+    
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.k:
+                items = np.sort(items)
+                
+                # An odd item out stays behind so the total weight is preserved
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[:len(items) - len(keep)]
+                promoted = pairs[self._rng.integers(2)::2]
+                
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+    
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        return items[order], weights[order]
+    
+    def quantiles(self, qs):
+        """Linear-interpolated quantiles; identical to np.percentile while the sketch is exact"""
+        if self.n == 0:
+            return np.full(len(qs), np.nan)
+        
+        items, weights = self._weighted_items()
+        upper_ranks = np.cumsum(weights) - 1
+        total = upper_ranks[-1] + 1
+        
+        result = []
+        for q in qs:
+            rank = q * (total - 1)
+            below = np.searchsorted(upper_ranks, np.floor(rank))
+            above = np.searchsorted(upper_ranks, min(np.floor(rank) + 1, total - 1))
+            result.append(_lerp(items[below:below + 1], items[above:above + 1], np.array([rank - np.floor(rank)]))[0])
+        return np.array(result)
+    
+    @property
+    def exact(self):
+        """True while nothing has been compacted, i.e. quantiles are the exact ones"""
+        return len(self.levels) == 1
+    
+    def rank(self, value, inclusive=False):
+        """Estimated number of values below (or at most) value"""
+        items, weights = self._weighted_items()
+        side = 'right' if inclusive else 'left'
+        return weights[:np.searchsorted(items, value, side=side)].sum()
+
+class HyperLogLog:
+    """
+    Mergeable distinct-count estimator with 2**precision one-byte registers
+    
+    Standard error is about 1.04 / sqrt(2**precision), with linear counting
+    for small cardinalities.
+    """
+    
+    def __init__(self, precision=12):
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+    
+    def update(self, values):
+        """Add an array of non-missing values (hashed with pandas' 64-bit hash)"""
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_array(np.asarray(values))
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+        
+        # Bit length of the remaining bits via frexp on exact 32-bit halves
+        high = (rest >> np.uint64(32)).astype(np.float64)
+        low = (rest & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        bit_length = np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+        rho = (64 - self.precision) - bit_length + 1
+        
+        np.maximum.at(self.registers, index, rho.astype(np.uint8))
+    
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+    
+    def count(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype(np.float64))
+        
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)
+        return estimate
+
+class HeavyHitters:
+    """
+    Mergeable Misra-Gries summary of the most frequent values
+    
+    Keeps at most capacity counters. Counts are exact while no more than
+    capacity distinct values were seen; otherwise each is an underestimate by
+    at most `error`. The row of each value's first appearance is kept to
+    order ties the way value_counts does.
+    """
+    
+    def __init__(self, capacity=100):
+        self.capacity = capacity
+        self.counts = pd.DataFrame({'count': pd.Series(dtype=np.int64), 'first': pd.Series(dtype=np.int64)})
+        self.error = 0
+    
+    @property
+    def exact(self):
+        return self.error == 0
+    
+    def update(self, values, offset=0):
+        """Add a 1D array or Series (missing values are skipped); offset is the row number of values[0]"""
+        codes, uniques = pd.factorize(values)
+        if len(uniques) == 0:
+            return
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        
+        # factorize numbers values by first appearance, so each new code raises the running maximum
+        running = np.maximum.accumulate(codes)
+        first = np.flatnonzero(np.diff(running, prepend=-1) > 0)
+        
+        chunk = pd.DataFrame({'count': counts, 'first': first + offset}, index=pd.Index(uniques, dtype=object))
+        self._combine(self._reduce(chunk))
+    
+    def merge(self, other, offset=0):
+        """Fold in another summary whose rows start at row number offset"""
+        self.error += other.error
+        self._combine(other.counts.assign(first=other.counts['first'] + offset))
+    
+    def _reduce(self, counts):
+        """Subtract the (capacity + 1)-th largest count and drop what falls to zero"""
+        if len(counts) <= self.capacity:
+            return counts
+        threshold = np.partition(counts['count'].to_numpy(), -(self.capacity + 1))[-(self.capacity + 1)]
+        counts = counts.assign(count=counts['count'] - threshold)
+        self.error += threshold
+        return counts[counts['count'] > 0]
+    
+    def _combine(self, counts):
+        if len(self.counts) > 0:
+            counts = pd.concat([self.counts, counts]).groupby(level=0, sort=False).agg({'count': 'sum', 'first': 'min'})
+        self.counts = self._reduce(counts)
+    
+    def top(self, n=10):
+        """The n most frequent values as a Series, ties in order of first appearance"""
+        ordered = self.counts.sort_values(['count', 'first'], ascending=[False, True], kind='stable')['count']
+        return ordered if n is None else ordered.head(n)
+
+class StreamingProfiler:
+    """
+    One-pass, out-of-core counterpart of DataAnalyzer
+    
+    Feed DataFrame chunks to update() (or use from_source for CSV/Parquet
+    files) and read basic_info, missing_value_analysis, statistical_summary
+    and IQR outlier counts in DataAnalyzer's formats. Memory is bounded by the
+    sketch sizes, not the number of rows, and profilers built on separate
+    shards can be combined with merge().
+    
+    Moments (mean, std, skewness, kurtosis), counts, nulls, min and max are
+    exact. Quantiles come from a QuantileSketch, distinct counts from
+    HyperLogLog unless fewer than top_k distinct values were seen, and modes
+    and top values from Misra-Gries summaries.
+    """
+    
+    def __init__(self, quantile_k=2048, hll_precision=12, top_k=100, tail_size=10000, seed=42):
+        self.quantile_k = quantile_k
+        self.hll_precision = hll_precision
+        self.top_k = top_k
+        self.tail_size = tail_size
+        self.seed = seed
+        
+        self.n_rows = 0
+        self.columns = None
+        self.numeric_columns = []
+        self.categorical_columns = []
+        self.dtypes = {}
+        self.memory_bytes = 0
+    
+    def _initialize(self, chunk):
+        self.columns = list(chunk.columns)
+        self.numeric_columns = chunk.select_dtypes(include=[np.number]).columns.tolist()
+        self.categorical_columns = chunk.select_dtypes(
+            exclude=[np.number, 'datetime', 'datetimetz', 'timedelta']).columns.tolist()
+        self.dtypes = dict(chunk.dtypes)
+        
+        p = len(self.numeric_columns)
+        self.null_counts = pd.Series(0, index=self.columns, dtype=np.int64)
+        self.count = np.zeros(p)
+        self.mean = np.zeros(p)
+        self.m2 = np.zeros(p)
+        self.m3 = np.zeros(p)
+        self.m4 = np.zeros(p)
+        self.minimum = np.full(p, np.nan)
+        self.maximum = np.full(p, np.nan)
+        
+        self.sketches = {col: QuantileSketch(self.quantile_k, self.seed) for col in self.numeric_columns}
+        self.low_tails = {col: np.empty(0) for col in self.numeric_columns}
+        self.high_tails = {col: np.empty(0) for col in self.numeric_columns}
+        self.distinct = {col: HyperLogLog(self.hll_precision) for col in self.numeric_columns + self.categorical_columns}
+        self.heavy_hitters = {col: HeavyHitters(self.top_k) for col in self.numeric_columns + self.categorical_columns}
+    
+    @classmethod
+    def from_source(cls, source, chunksize=100000, columns=None, dtype=None, **kwargs):
+        """Profile a CSV/Parquet path or DataFrame in one streaming pass
+        
+        Column types are taken from the first chunk. Pass dtype (as for
+        read_csv, e.g. {'code': str}) when a CSV column only shows
+        non-numeric values further down the file.
+        """
+        profiler = cls(**kwargs)
+        for chunk in iter_table_chunks(source, chunksize, columns, dtype):
+            profiler.update(chunk)
+        return profiler
+    
+    def update(self, chunk):
+        """Fold one DataFrame chunk into the accumulators"""
+        if self.columns is None:
+            self._initialize(chunk)
+        
+        # Checked before any accumulator changes, so the profiler stays usable after the error
+        for col in self.numeric_columns:
+            if col in chunk.columns and not pd.api.types.is_numeric_dtype(chunk[col].dtype):
+                raise ValueError(
+                    f"Column {col!r} was numeric in earlier chunks but has non-numeric values in rows "
+                    f"{self.n_rows}-{self.n_rows + len(chunk) - 1}; pass dtype={{{col!r}: str}} to "
+                    f"from_source to profile it as categorical"
+                )
+        
+        for col, dtype in chunk.dtypes.items():
+            if dtype != self.dtypes.get(col):
+                # e.g. an int column that gains missing values in a later CSV chunk
+                numeric = pd.api.types.is_numeric_dtype(dtype) and pd.api.types.is_numeric_dtype(self.dtypes.get(col))
+                self.dtypes[col] = np.dtype(np.float64) if numeric else np.dtype(object)
+        
+        offset = self.n_rows
+        self.n_rows += len(chunk)
+        self.memory_bytes += chunk.memory_usage(deep=True, index=False).sum()
+        self.null_counts += chunk.isnull().sum().reindex(self.columns, fill_value=0)
+        
+        if self.numeric_columns:
+            values = chunk[self.numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            self._update_moments(values)
+            
+            for j, col in enumerate(self.numeric_columns):
+                column = values[:, j]
+                present = column[~np.isnan(column)]
+                self.sketches[col].update(present)
+                self.low_tails[col] = _smallest(np.concatenate([self.low_tails[col], present]), self.tail_size)
+                self.high_tails[col] = -_smallest(-np.concatenate([self.high_tails[col], present]), self.tail_size)
+                self.distinct[col].update(present)
+                self.heavy_hitters[col].update(column, offset)
+        
+        for col in self.categorical_columns:
+            column = chunk[col]
+            self.distinct[col].update(column.dropna().to_numpy(dtype=object))
+            self.heavy_hitters[col].update(column, offset)
+        
+        return self
+    
+    def _update_moments(self, values):
+        """Chunk moments per column, combined with the running ones by the pairwise update formulas"""
+        mask = ~np.isnan(values)
+        n_b = mask.sum(axis=0).astype(float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_b = np.where(mask, values, 0).sum(axis=0) / n_b
+            delta_b = np.where(mask, values - mean_b, 0)
+            squared = delta_b * delta_b
+            m2_b = squared.sum(axis=0)
+            m3_b = (squared * delta_b).sum(axis=0)
+            m4_b = (squared * squared).sum(axis=0)
+            min_b = np.nanmin(np.where(mask, values, np.inf), axis=0) if len(values) else np.full(len(n_b), np.inf)
+            max_b = np.nanmax(np.where(mask, values, -np.inf), axis=0) if len(values) else np.full(len(n_b), -np.inf)
+        
+        has_b = n_b > 0
+        self.minimum = np.where(has_b, np.fmin(self.minimum, min_b), self.minimum)
+        self.maximum = np.where(has_b, np.fmax(self.maximum, max_b), self.maximum)
+        self._combine_moments(n_b, np.where(has_b, mean_b, 0), m2_b, m3_b, m4_b)
+    
+    def _combine_moments(self, n_b, mean_b, m2_b, m3_b, m4_b):
+        n_a, mean_a, m2_a, m3_a, m4_a = self.count, self.mean, self.m2, self.m3, self.m4
+        n = n_a + n_b
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean_b - mean_a
+            delta_n = np.where(n > 0, delta / n, 0)
+            mean = mean_a + delta_n * n_b
+            m2 = m2_a + m2_b + delta * delta_n * n_a * n_b
+            m3 = (m3_a + m3_b + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+                  + 3 * delta_n * (n_a * m2_b - n_b * m2_a))
+            m4 = (m4_a + m4_b + delta * delta_n ** 3 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2)
+                  + 6 * delta_n ** 2 * (n_a ** 2 * m2_b + n_b ** 2 * m2_a) + 4 * delta_n * (n_a * m3_b - n_b * m3_a))
+        
+        self.count = n
+        self.mean = np.where(n > 0, mean, 0)
+        self.m2 = np.where(n > 0, m2, 0)
+        self.m3 = np.where(n > 0, m3, 0)
+        self.m4 = np.where(n > 0, m4, 0)
+    
+    def merge(self, other):
+        """Combine with a profiler built over another shard of the same columns"""
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self._initialize(pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in other.dtypes.items()}))
+        
+        # Rows of the other shard come after ours for first-appearance ordering
+        offset = self.n_rows
+        self.n_rows += other.n_rows
+        self.memory_bytes += other.memory_bytes
+        self.null_counts += other.null_counts
+        self.minimum = np.fmin(self.minimum, other.minimum)
+        self.maximum = np.fmax(self.maximum, other.maximum)
+        self._combine_moments(other.count, other.mean, other.m2, other.m3, other.m4)
+        
+        for col in self.numeric_columns:
+            self.sketches[col].merge(other.sketches[col])
+            self.low_tails[col] = _smallest(np.concatenate([self.low_tails[col], other.low_tails[col]]), self.tail_size)
+            self.high_tails[col] = -_smallest(-np.concatenate([self.high_tails[col], other.high_tails[col]]),
+                                              self.tail_size)
+        for col in self.distinct:
+            self.distinct[col].merge(other.distinct[col])
+            self.heavy_hitters[col].merge(other.heavy_hitters[col], offset)
+        return self
+    
+    def _unique_count(self, col):
+        summary = self.heavy_hitters[col]
+        if summary.exact:
+            return len(summary.counts)
+        return int(round(self.distinct[col].count()))
+    
+    def basic_info(self):
+        """Same keys as DataAnalyzer.basic_info; memory is the in-memory size the full frame would take"""
+        return {
+            'shape': (self.n_rows, len(self.columns or [])),
+            'columns': list(self.columns or []),
+            'numeric_columns': self.numeric_columns,
+            'categorical_columns': self.categorical_columns,
+            'memory_usage_mb': self.memory_bytes / 1024**2,
+            'dtypes': dict(self.dtypes)
+        }
+    
+    def missing_value_analysis(self):
+        """Same frame as DataAnalyzer.missing_value_analysis"""
+        missing_data = self.null_counts
+        missing_percent = (missing_data / self.n_rows) * 100
+        
+        missing_df = pd.DataFrame({
+            'Column': missing_data.index,
+            'Missing_Count': missing_data.values,
+            'Missing_Percentage': missing_percent.values
+        })
+        
+        missing_df = missing_df[missing_df['Missing_Count'] > 0].sort_values('Missing_Count', ascending=False)
+        return missing_df
+    
+    def quantiles(self, column, qs):
+        """Sketch quantiles of one numeric column"""
+        return self.sketches[column].quantiles(qs)
+    
+    def statistical_summary(self, top_n=10):
+        """Same layout as DataAnalyzer.statistical_summary, from the accumulators"""
+        summary = {}
+        
+        if self.numeric_columns:
+            n = self.count
+            with np.errstate(invalid='ignore', divide='ignore'):
+                std = np.where(n > 1, np.sqrt(self.m2 / (n - 1)), np.nan)
+                m2 = self.m2 / n
+                constant = m2 <= (np.finfo(float).resolution * self.mean) ** 2
+                skewness = np.where(constant, np.nan, (self.m3 / n) / m2 ** 1.5)
+                kurtosis = np.where(constant, np.nan, (self.m4 / n) / m2 ** 2 - 3)
+            
+            quantiles = np.array([self.sketches[col].quantiles((0.25, 0.5, 0.75)) for col in self.numeric_columns]).T
+            modes = []
+            for j, col in enumerate(self.numeric_columns):
+                heavy = self.heavy_hitters[col]
+                top = heavy.top(None)
+                if len(top) == 0 or top.iloc[0] <= heavy.error:
+                    # No value is known to repeat more than any other; as with unique values, take the smallest
+                    modes.append(self.minimum[j])
+                else:
+                    # Like Series.mode: the smallest of the most frequent values
+                    modes.append(min(top.index[top == top.iloc[0]]))
+            
+            rows = [n, np.where(n > 0, self.mean, np.nan), std, self.minimum, *quantiles, self.maximum,
+                    skewness, kurtosis, quantiles[1], np.array(modes, dtype=np.float64)]
+            summary['numeric'] = pd.DataFrame(np.vstack(rows), index=SUMMARY_INDEX, columns=self.numeric_columns)
+        
+        if self.categorical_columns:
+            categorical_summary = {}
+            for col in self.categorical_columns:
+                top = self.heavy_hitters[col].top(top_n)
+                categorical_summary[col] = {
+                    'unique_count': self._unique_count(col),
+                    'most_frequent': top.index[0] if len(top) > 0 else None,
+                    'most_frequent_count': top.iloc[0] if len(top) > 0 else 0,
+                    'value_counts': dict(top)
+                }
+            summary['categorical'] = categorical_summary
+        
+        return summary
+    
+    def outlier_detection(self, method='iqr', threshold=None):
+        """Per-column IQR outlier counts (no row indices in a single pass)
+        
+        The bounds come from the quantile sketch. Values beyond them are
+        counted from the retained tails when fewer than tail_size lie on a
+        side, otherwise estimated from the sketch. 'exact' is True only when
+        the bounds are exact too (at most quantile_k values in the column) and
+        the counts came from the tails.
+        """
+        if method != 'iqr':
+            raise ValueError("Streaming outlier detection supports method='iqr' only")
+        k = 1.5 if threshold is None else threshold
+        
+        outliers = {}
+        for col in self.numeric_columns:
+            sketch = self.sketches[col]
+            q1, q3 = sketch.quantiles((0.25, 0.75))
+            lower_bound = q1 - k * (q3 - q1)
+            upper_bound = q3 + k * (q3 - q1)
+            
+            low, high = self.low_tails[col], self.high_tails[col]
+            below = np.count_nonzero(low < lower_bound)
+            above = np.count_nonzero(high > upper_bound)
+            low_exact = below < len(low) or len(low) == sketch.n
+            high_exact = above < len(high) or len(high) == sketch.n
+            if not low_exact:
+                below = sketch.rank(lower_bound)
+            if not high_exact:
+                above = sketch.n - sketch.rank(upper_bound, inclusive=True)
+            
+            count = int(below + above)
+            outliers[col] = {
+                'count': count,
+                'percentage': (count / self.n_rows) * 100 if self.n_rows else 0.0,
+                'exact': bool(sketch.exact and low_exact and high_exact)
+            }
+        
+        return outliers
+
+def _smallest(values, size):
+    """The size smallest values, unordered"""
+    if len(values) <= size:
+        return values
+    return np.partition(values, size - 1)[:size]